@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Parser backend benchmark.
+
+Times HDFCScraper.parse_card_page (parse + text and section extraction)
+with each parser backend over stored HTML fixtures, and checks that the
+backends extract the same text.
+
+Usage:
+    python benchmarks/bench_parsers.py
+    python benchmarks/bench_parsers.py --fixtures path/to/pages --repeat 50
+"""
+
+import sys
+from pathlib import Path
+
+# Add python directory to path for proper module resolution
+PYTHON_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(PYTHON_DIR))
+
+import argparse
+import time
+
+from scrapers import HDFCScraper, ScraperConfig
+from scrapers.parsers import PARSER_BACKENDS
+
+
+DEFAULT_FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def time_backend(backend: str, pages: dict[str, str], repeat: int) -> tuple[float, dict[str, str]]:
+    """
+    Parse every page `repeat` times with one backend.
+
+    Returns:
+        (seconds per page, extracted text by fixture name)
+    """
+    scraper = HDFCScraper(ScraperConfig(parser_backend=backend))
+    texts = {}
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for name, html in pages.items():
+            raw = scraper.parse_card_page(f"https://fixtures/{name}", html)
+            texts[name] = raw.text_content
+    elapsed = time.perf_counter() - started
+
+    return elapsed / (repeat * len(pages)), texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends")
+    parser.add_argument(
+        "--fixtures",
+        type=Path,
+        default=DEFAULT_FIXTURES,
+        help="Directory of .html pages (default: benchmarks/fixtures)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=20,
+        help="Times each page is parsed per backend (default: 20)"
+    )
+    args = parser.parse_args()
+
+    pages = {
+        path.name: path.read_text(encoding="utf-8")
+        for path in sorted(args.fixtures.glob("*.html"))
+    }
+    if not pages:
+        print(f"No .html fixtures found in {args.fixtures}")
+        return
+
+    total_kb = sum(len(html) for html in pages.values()) / 1024
+    print(f"{len(pages)} fixtures ({total_kb:.0f} KB), {args.repeat} rounds\n")
+
+    results = {}
+    for backend in PARSER_BACKENDS:
+        per_page, texts = time_backend(backend, pages, args.repeat)
+        results[backend] = (per_page, texts)
+        print(f"  {backend:6s} {per_page * 1000:8.2f} ms/page")
+
+    baseline, _ = results["bs4"]
+    fast, _ = results["lxml"]
+    print(f"\nlxml speedup: {baseline / fast:.1f}x")
+
+    mismatched = [
+        name for name in pages
+        if results["bs4"][1][name] != results["lxml"][1][name]
+    ]
+    if mismatched:
+        print(f"Text differs between backends for: {', '.join(mismatched)}")
+    else:
+        print("Both backends extracted identical text")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Local mock bank website for scraper load testing.
+
+Serves a synthetic HDFC-style credit card listing and card detail pages,
+with configurable card count, page size, latency and injected 5xx/429
+errors, so concurrency, rate limiting and retry changes can be measured
+against thousands of cards without touching real bank sites.
+
+Usage:
+    python benchmarks/mock_bank_server.py --cards 5000 --latency 0.05
+    python benchmarks/mock_bank_server.py --error-rate 0.02 --rate-limit-rate 0.05
+
+Then point the scraper at it:
+    python main.py scrape --bank hdfc --base-url http://127.0.0.1:8765 --no-cache
+
+Or from code:
+    with MockBankServer(MockBankOptions(cards=500)) as server:
+        scraper = HDFCScraper(ScraperConfig(base_url=server.url))
+        cards = scraper.scrape_all_cards()
+        print(server.stats())
+
+GET /__stats returns the request counters as JSON.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+
+LISTING_PATH = "/personal/pay/cards/credit-cards"
+
+WORDS = (
+    "reward points cashback lounge access annual fee waiver joining spend milestone "
+    "fuel surcharge dining travel insurance foreign currency markup interest rate "
+    "eligibility salary income customers partner merchant offer benefits cover"
+).split()
+
+NETWORKS = ["Visa", "Mastercard", "RuPay", "Diners Club"]
+
+
+@dataclass
+class MockBankOptions:
+    """Shape and behaviour of the mock bank site."""
+
+    cards: int = 100
+    cards_per_listing_page: int = 0  # 0 lists every card on one page
+    page_kb: int = 40  # Approximate size of each card page
+
+    # Response timing: latency + uniform(0, jitter) seconds per request
+    latency: float = 0.0
+    jitter: float = 0.0
+
+    # Fault injection, as a fraction of requests
+    error_rate: float = 0.0  # 503 Service Unavailable
+    rate_limit_rate: float = 0.0  # 429 Too Many Requests
+    retry_after: int = 1  # Retry-After seconds sent with 429s
+
+    seed: int = 0
+
+
+def card_slug(index: int) -> str:
+    """URL slug of a synthetic card; matches HDFCScraper.is_card_page_url."""
+    return f"synthetic-{index:05d}-credit-card"
+
+
+def card_name(index: int) -> str:
+    return f"Synthetic {index:05d}"
+
+
+class MockBankSite:
+    """Renders the synthetic pages; deterministic for a given seed."""
+
+    def __init__(self, options: MockBankOptions):
+        self.options = options
+
+    def _sentence(self, rng: random.Random, words: int = 12) -> str:
+        text = " ".join(rng.choice(WORDS) for _ in range(words))
+        return text.capitalize() + "."
+
+    def listing_page(self, page: int) -> Optional[str]:
+        """The card listing, or None past the last page."""
+        per_page = self.options.cards_per_listing_page or max(1, self.options.cards)
+        pages = max(1, -(-self.options.cards // per_page))
+        if page < 1 or page > pages:
+            return None
+
+        first = (page - 1) * per_page + 1
+        last = min(self.options.cards, page * per_page)
+        items = "".join(
+            f'<li class="card-tile"><a href="{LISTING_PATH}/{card_slug(i)}">{escape(card_name(i))} Credit Card</a>'
+            f' <a href="{LISTING_PATH}/{card_slug(i)}/apply">Apply now</a></li>'
+            for i in range(first, last + 1)
+        )
+        pager = "".join(
+            f'<a class="page-link" href="{LISTING_PATH}?page={n}">{n}</a>'
+            for n in range(1, pages + 1)
+        )
+        return (
+            "<!DOCTYPE html><html><head><title>Credit Cards - HDFC Bank</title></head><body>"
+            '<header class="site-header"><nav><a href="/">Home</a></nav></header>'
+            f'<main><h1>Credit Cards</h1><ul class="cards">{items}</ul>'
+            f'<div class="pagination">{pager}</div></main>'
+            "<footer>Mock bank</footer></body></html>"
+        )
+
+    def card_page(self, index: int) -> Optional[str]:
+        """A card detail page, or None for an unknown card."""
+        if index < 1 or index > self.options.cards:
+            return None
+
+        rng = random.Random(f"{self.options.seed}:{index}")
+        name = escape(card_name(index))
+        joining_fee = rng.choice([0, 500, 1000, 2500, 10000])
+        annual_fee = rng.choice([0, 500, 1000, 2500, 10000])
+
+        sections = [
+            ("Features &amp; Benefits", "".join(
+                f"<li>{self._sentence(rng)}</li>" for _ in range(6)
+            ), "ul"),
+            ("Fees &amp; Charges", (
+                f"<p>Joining fee: Rs. {joining_fee} + GST</p>"
+                f"<p>Annual fee: Rs. {annual_fee} + GST, waived on annual spends above "
+                f"Rs. {rng.choice([100000, 300000, 500000])}</p>"
+                f"<p>Foreign currency markup: {rng.choice(['3.5', '2', '0.99'])}%</p>"
+            ), "div"),
+            ("Eligibility", (
+                f"<p>Salaried Indian national, age 21-60 years, gross monthly income above "
+                f"Rs. {rng.choice([15000, 25000, 50000, 100000])}. {self._sentence(rng)}</p>"
+            ), "div"),
+            ("Reward Points", f"<p>{self._sentence(rng, 20)}</p>", "div"),
+            ("Interest Rates", (
+                f"<p>Interest of {rng.choice(['3.6', '3.49', '1.99'])}% per month on revolving credit. "
+                f"{self._sentence(rng)}</p>"
+            ), "div"),
+        ]
+        body = "".join(
+            f'<div class="accordion-item"><h2>{header}</h2><{tag} class="content">{content}</{tag}></div>'
+            for header, content, tag in sections
+        )
+
+        html = (
+            "<!DOCTYPE html><html><head>"
+            f"<title>{name} Credit Card - HDFC Bank</title>"
+            "<style>.accordion{display:none}</style>"
+            "<script>window.dataLayer=window.dataLayer||[];</script></head><body>"
+            '<header class="site-header"><nav><a href="/">Home</a> '
+            f'<a href="{LISTING_PATH}">Credit Cards</a></nav></header>'
+            f'<main id="main-content"><section class="hero"><h1>{name} Credit Card</h1>'
+            f"<p>{rng.choice(NETWORKS)} card. {self._sentence(rng, 20)}</p></section>"
+            f'<div class="accordion">{body}</div>'
+        )
+
+        # Pad with disclaimer text up to the requested page size
+        filler = []
+        size = len(html)
+        target = self.options.page_kb * 1024
+        while size < target:
+            paragraph = f"<p>{self._sentence(rng, 30)}</p>"
+            filler.append(paragraph)
+            size += len(paragraph)
+
+        return (
+            f'{html}<div class="disclaimer">{"".join(filler)}</div></main>'
+            "<footer><p>Mock bank</p></footer></body></html>"
+        )
+
+
+class MockBankServer:
+    """
+    Threaded HTTP server for a MockBankSite.
+
+    Pass port=0 to pick a free port; the server's address is in .url.
+    """
+
+    def __init__(
+        self,
+        options: Optional[MockBankOptions] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.options = options or MockBankOptions()
+        self.site = MockBankSite(self.options)
+        self._rng = random.Random(self.options.seed)
+        self._lock = threading.Lock()
+        self._counts: dict[str, int] = {}
+        self._thread: Optional[threading.Thread] = None
+
+        handler = type("Handler", (_MockBankHandler,), {"server_state": self})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key: str):
+        with self._lock:
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    def stats(self) -> dict[str, int]:
+        """Requests served, by response status."""
+        with self._lock:
+            return dict(sorted(self._counts.items()))
+
+    def roll_fault(self) -> Optional[int]:
+        """Pick an injected error status for a request, if any."""
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.options.rate_limit_rate:
+            return 429
+        if roll < self.options.rate_limit_rate + self.options.error_rate:
+            return 503
+        return None
+
+    def delay(self) -> float:
+        with self._lock:
+            return self.options.latency + self._rng.uniform(0, self.options.jitter)
+
+    def start(self) -> "MockBankServer":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> "MockBankServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _MockBankHandler(BaseHTTPRequestHandler):
+    server_state: MockBankServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        state = self.server_state
+        parsed = urlparse(self.path)
+
+        if parsed.path == "/__stats":
+            self._send(200, json.dumps(state.stats()), "application/json")
+            return
+
+        delay = state.delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        fault = state.roll_fault()
+        if fault == 429:
+            self._send(429, "Too Many Requests", headers={"Retry-After": str(state.options.retry_after)})
+            return
+        if fault:
+            self._send(fault, "Service Unavailable")
+            return
+
+        html = self._render(parsed.path.rstrip("/"), parse_qs(parsed.query))
+        if html is None:
+            self._send(404, "Not Found")
+            return
+
+        etag = '"' + hashlib.sha256(html.encode("utf-8")).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self._send(304, "", headers={"ETag": etag})
+            return
+        self._send(200, html, headers={"ETag": etag})
+
+    def _render(self, path: str, query: dict) -> Optional[str]:
+        site = self.server_state.site
+        if path == LISTING_PATH:
+            try:
+                page = int(query.get("page", ["1"])[0])
+            except ValueError:
+                return None
+            return site.listing_page(page)
+
+        prefix = f"{LISTING_PATH}/synthetic-"
+        if path.startswith(prefix) and path.endswith("-credit-card"):
+            number = path[len(prefix):-len("-credit-card")]
+            if number.isdigit():
+                return site.card_page(int(number))
+        return None
+
+    def _send(
+        self,
+        status: int,
+        body: str,
+        content_type: str = "text/html; charset=utf-8",
+        headers: Optional[dict] = None,
+    ):
+        self.server_state.count(str(status))
+        payload = body.encode("utf-8") if status != 304 else b""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        # Per-request logging would swamp load tests
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a mock bank website for load testing")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port (default: 8765)")
+    parser.add_argument("--cards", type=int, default=100, help="Number of cards (default: 100)")
+    parser.add_argument(
+        "--per-page",
+        type=int,
+        default=0,
+        help="Cards per listing page; 0 lists all cards on one page (default: 0)"
+    )
+    parser.add_argument("--page-kb", type=int, default=40, help="Approximate card page size in KB (default: 40)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s (default: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for page content and fault injection")
+    args = parser.parse_args()
+
+    options = MockBankOptions(
+        cards=args.cards,
+        cards_per_listing_page=args.per_page,
+        page_kb=args.page_kb,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    server = MockBankServer(options, host=args.host, port=args.port)
+    print(f"Mock bank with {options.cards} cards at {server.url}{LISTING_PATH}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"\nRequests served: {server.stats()}")
+
+
+if __name__ == "__main__":
+    main()
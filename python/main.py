@@ -5,9 +5,10 @@ Credit Card Data Pipeline - Main CLI Entry Point
 Usage:
     python main.py scrape --bank hdfc
     python main.py scrape --bank all
-    python main.py process --input raw_data.json --output cards.json
+    python main.py process --input raw_data.jsonl --output cards.json
     python main.py validate --input cards.json
     python main.py export --output ../src/data/cards.json
+    python main.py reparse --bank hdfc --output raw_hdfc.jsonl
 """
 
 import sys
@@ -19,12 +20,22 @@ sys.path.insert(0, str(PYTHON_DIR))
 
 import json
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterable, Optional
 
 from models import CardsData, CreditCard, RawCardData
-from scrapers import HDFCScraper, BaseScraper
-from processors import OllamaProcessor, SchemaValidator
+from scrapers import HDFCScraper, BaseScraper, HTMLArchive, ScraperConfig
+from scrapers import RawCardWriter, iter_raw_cards
+from scrapers.raw_store import read_content_hashes, read_scraped_urls
+from processors import (
+    BoilerplateFilter,
+    ChangeManifest,
+    OllamaProcessor,
+    ProcessorConfig,
+    SchemaValidator,
+)
 
 
 # Bank scraper registry
@@ -46,114 +57,423 @@ def get_output_dir() -> Path:
     return output_dir
 
 
-def scrape_bank(bank: str, output_file: Optional[str] = None) -> list[RawCardData]:
+def get_archive_dir() -> Path:
+    """Get the raw HTML archive directory path."""
+    return get_output_dir() / "archive"
+
+
+def build_scraper_config(
+    use_cache: bool = True,
+    offline: bool = False,
+    archive: bool = False,
+    record: Optional[str] = None,
+    replay: Optional[str] = None,
+    replay_latency: bool = False,
+    base_url: Optional[str] = None,
+) -> ScraperConfig:
+    """
+    Build the scraper configuration shared by CLI scrape runs.
+    
+    Args:
+        use_cache: Keep an HTTP cache in output/ and send conditional requests
+        offline: Serve pages only from the HTTP cache, without network access
+        archive: Store every fetched page in the raw HTML archive
+        record: Cassette name (in output/cassettes/) to record requests into
+        replay: Cassette name (in output/cassettes/) to serve responses from
+        replay_latency: Replay responses with their recorded latency
+        base_url: Scrape this site root instead of the bank's (e.g. a mock server)
+    """
+    cassette_path = None
+    cassette_mode = "replay"
+    if record or replay:
+        cassette_dir = get_output_dir() / "cassettes"
+        cassette_dir.mkdir(exist_ok=True)
+        cassette_path = str(cassette_dir / (record or replay))
+        if record:
+            cassette_mode = "record"
+            # Start a fresh recording; every bank's scraper appends to it
+            open(cassette_path, "w").close()
+        # Conditional requests would make recordings depend on cache state
+        use_cache = False
+    
+    cache_path = None
+    if use_cache or offline:
+        cache_path = str(get_output_dir() / "http_cache.sqlite")
+    return ScraperConfig(
+        cache_path=cache_path,
+        cache_only=offline,
+        archive_dir=str(get_archive_dir()) if archive else None,
+        cassette_path=cassette_path,
+        cassette_mode=cassette_mode,
+        replay_latency=replay_latency,
+        base_url=base_url,
+        frontier_dir=str(get_output_dir() / "frontier"),
+    )
+
+
+def save_raw_data(raw_cards: Iterable[RawCardData], output_path: Path):
+    """Write raw card records to a JSONL file (gzipped if it ends in .gz)."""
+    with RawCardWriter(output_path) as writer:
+        for card in raw_cards:
+            writer.write(card)
+
+
+class ChangeCounter:
+    """
+    Flags scraped cards whose content matches a previous raw data file.
+    
+    Only the previous content hashes are held in memory, so it can sit in
+    front of a streaming writer.
+    """
+    
+    def __init__(self, previous_path: Path):
+        self.previous = read_content_hashes(previous_path)
+        self.changed = 0
+        self.total = 0
+        self._lock = threading.Lock()
+    
+    def __call__(self, card: RawCardData):
+        card.unchanged = self.previous.get(card.url) == card.content_hash
+        with self._lock:
+            self.total += 1
+            self.changed += not card.unchanged
+    
+    def report(self):
+        if self.previous:
+            print(f"{self.changed}/{self.total} cards changed since last scrape")
+
+
+class ScrapeCancelled(Exception):
+    """Raised inside a scrape that was abandoned, to stop it saving cards."""
+
+
+def scrape_bank(
+    bank: str,
+    output_file: Optional[str] = None,
+    config: Optional[ScraperConfig] = None,
+    resume: bool = False,
+    writer: Optional[RawCardWriter] = None,
+    skip_urls: Optional[set[str]] = None,
+    on_card: Optional[Callable[[RawCardData], None]] = None,
+    cancel: Optional[threading.Event] = None,
+) -> int:
     """
     Scrape credit card data from a specific bank.
     
+    Cards are appended to the output file as soon as they are scraped, so
+    an interrupted scrape keeps everything saved so far.
+    
     Args:
         bank: Bank identifier (e.g., 'hdfc', 'icici')
-        output_file: Optional file to save raw data
+        output_file: File (in output/) to save raw data to
+        config: Scraper configuration (defaults to ScraperConfig())
+        resume: Keep the cards already in output_file and skip their URLs
+        writer: Shared writer to save cards to, instead of output_file
+        skip_urls: Card URLs to leave out (with a shared writer)
+        on_card: Also called with every scraped card
+        cancel: Once set, the next scraped card raises ScrapeCancelled
+            instead of being saved
         
     Returns:
-        List of RawCardData objects
+        Number of cards scraped
     """
     if bank not in BANK_SCRAPERS:
         available = ", ".join(BANK_SCRAPERS.keys())
         raise ValueError(f"Unknown bank '{bank}'. Available: {available}")
     
     scraper_class = BANK_SCRAPERS[bank]
-    scraper = scraper_class()
+    scraper = scraper_class(config)
     
     print(f"\n{'='*60}")
     print(f"Scraping {scraper.get_issuer_name()}")
     print(f"{'='*60}\n")
     
-    raw_cards = scraper.scrape_all_cards()
-    
-    # Save raw data if output file specified
-    if output_file:
+    output_path = None
+    changes = None
+    if output_file and writer is None:
         output_path = get_output_dir() / output_file
-        raw_data_json = [
-            {
-                "url": card.url,
-                "text_content": card.text_content,
-                "page_title": card.page_title,
-                "issuer": card.issuer,
-                "scraped_at": card.scraped_at.isoformat(),
-            }
-            for card in raw_cards
-        ]
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(raw_data_json, f, indent=2, ensure_ascii=False)
+        if resume:
+            skip_urls = read_scraped_urls(output_path)
+        else:
+            changes = ChangeCounter(output_path)
+        writer = RawCardWriter(output_path, append=resume)
+    
+    scraped = 0
+    
+    def save(card: RawCardData):
+        nonlocal scraped
+        if cancel is not None and cancel.is_set():
+            raise ScrapeCancelled(f"{bank} scrape was cancelled")
+        if writer is not None and writer.closed:
+            raise ScrapeCancelled(f"output for {bank} is already closed")
+        scraped += 1
+        if changes:
+            changes(card)
+        if on_card:
+            on_card(card)
+        if writer:
+            writer.write(card)
+    
+    try:
+        scraper.scrape_all_cards(on_card=save, skip_urls=skip_urls)
+    finally:
+        if output_path:
+            writer.close()
+    
+    if output_path:
+        if changes:
+            changes.report()
         print(f"\nRaw data saved to: {output_path}")
     
-    return raw_cards
+    return scraped
 
 
-def scrape_all_banks(output_file: Optional[str] = None) -> list[RawCardData]:
-    """Scrape all supported banks."""
-    all_raw_cards = []
+def _scrape_bank_with_timeout(
+    bank: str,
+    timeout: Optional[float],
+    config: Optional[ScraperConfig] = None,
+    **kwargs,
+) -> int:
+    """
+    Run scrape_bank in a daemon thread and give up after `timeout` seconds.
+    
+    A timed-out scrape cannot be killed; it is abandoned. Cards it already
+    saved are kept, and it is cancelled so it saves no more once its
+    current page finishes.
+    """
+    outcome = {}
+    cancel = threading.Event()
     
-    for bank in BANK_SCRAPERS:
+    def run():
         try:
-            raw_cards = scrape_bank(bank)
-            all_raw_cards.extend(raw_cards)
+            outcome["count"] = scrape_bank(bank, config=config, cancel=cancel, **kwargs)
         except Exception as e:
-            print(f"Error scraping {bank}: {e}")
+            outcome["error"] = e
+    
+    worker = threading.Thread(target=run, name=f"scrape-{bank}", daemon=True)
+    worker.start()
+    worker.join(timeout)
+    
+    if worker.is_alive():
+        cancel.set()
+        raise TimeoutError(f"timed out after {timeout:.0f}s")
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["count"]
+
+
+def scrape_all_banks(
+    output_file: str,
+    max_workers: int = 4,
+    bank_timeout: Optional[float] = 1800,
+    config: Optional[ScraperConfig] = None,
+    resume: bool = False,
+) -> int:
+    """
+    Scrape all supported banks in parallel.
     
-    if output_file:
-        output_path = get_output_dir() / output_file
-        raw_data_json = [
-            {
-                "url": card.url,
-                "text_content": card.text_content,
-                "page_title": card.page_title,
-                "issuer": card.issuer,
-                "scraped_at": card.scraped_at.isoformat(),
-            }
-            for card in all_raw_cards
-        ]
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(raw_data_json, f, indent=2, ensure_ascii=False)
-        print(f"\nAll raw data saved to: {output_path}")
-    
-    return all_raw_cards
-
-
-def process_raw_data(input_file: str, output_file: str, model: Optional[str] = None):
+    Each bank runs in its own worker with its own scraper (and therefore
+    its own per-host rate limits), so total time approaches that of the
+    slowest bank rather than the sum. Every bank appends to the same
+    output file as its cards are scraped.
+    
+    Args:
+        output_file: File (in output/) to save the merged raw data to
+        max_workers: Maximum number of banks scraped at once
+        bank_timeout: Seconds before a single bank's scrape is abandoned
+            (None for no limit)
+        config: Scraper configuration used for every bank
+        resume: Keep the cards already in output_file and skip their URLs
+        
+    Returns:
+        Number of cards scraped
+    """
+    banks = list(BANK_SCRAPERS)
+    output_path = get_output_dir() / output_file
+    skip_urls = read_scraped_urls(output_path) if resume else set()
+    changes = None if resume else ChangeCounter(output_path)
+    total = 0
+    
+    with RawCardWriter(output_path, append=resume) as writer:
+        def scrape(bank: str) -> int:
+            return _scrape_bank_with_timeout(
+                bank, bank_timeout, config,
+                writer=writer, skip_urls=skip_urls, on_card=changes,
+            )
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = {bank: executor.submit(scrape, bank) for bank in banks}
+            for bank, future in futures.items():
+                try:
+                    total += future.result()
+                except Exception as e:
+                    print(f"Error scraping {bank}: {e}")
+    
+    if changes:
+        changes.report()
+    print(f"\nAll raw data saved to: {output_path}")
+    return total
+
+
+def reparse_archive(
+    bank: str,
+    output_file: str,
+    as_of: Optional[datetime] = None,
+) -> list[RawCardData]:
+    """
+    Rebuild raw card data from archived HTML, without network access.
+    
+    Args:
+        bank: Bank identifier (e.g., 'hdfc')
+        output_file: File to save the re-parsed raw data
+        as_of: Use the newest pages scraped before this time
+        
+    Returns:
+        List of RawCardData objects (empty if the bank's scraper can't
+        re-parse archived pages)
+    """
+    if bank not in BANK_SCRAPERS:
+        available = ", ".join(BANK_SCRAPERS.keys())
+        raise ValueError(f"Unknown bank '{bank}'. Available: {available}")
+    
+    scraper_class = BANK_SCRAPERS[bank]
+    if not scraper_class.supports_reparse():
+        print(f"The {bank} scraper doesn't support reparse (no parse_card_page)")
+        return []
+    
+    archive = HTMLArchive(get_archive_dir())
+    scraper = scraper_class(build_scraper_config(use_cache=False))
+    raw_cards = scraper.scrape_archive(archive, as_of)
+    
+    output_path = get_output_dir() / output_file
+    save_raw_data(raw_cards, output_path)
+    print(f"\nRaw data saved to: {output_path}")
+    
+    return raw_cards
+
+
+def show_archive(train_bank: Optional[str] = None):
+    """
+    Print raw HTML archive statistics, optionally training a dictionary first.
+    
+    Args:
+        train_bank: Bank whose archived pages should train a new zstd dictionary
+            (or 'all')
+    """
+    archive = HTMLArchive(get_archive_dir())
+    
+    if train_bank:
+        banks = list(BANK_SCRAPERS) if train_bank == "all" else [train_bank]
+        for bank in banks:
+            issuer = BANK_SCRAPERS[bank](ScraperConfig()).get_issuer_name()
+            archive.train_dictionary(issuer)
+    
+    stats = archive.stats()
+    ratio = stats["size"] / stats["stored_size"] if stats["stored_size"] else 0
+    print(f"Archived pages: {stats['blobs']}")
+    print(f"Raw size: {stats['size']:,} bytes")
+    print(f"Stored size: {stats['stored_size']:,} bytes ({ratio:.1f}x compression)")
+
+
+def process_raw_data(
+    input_file: str,
+    output_file: str,
+    model: Optional[str] = None,
+    force: bool = False,
+    keep_boilerplate: bool = False,
+    config: Optional[ProcessorConfig] = None,
+):
     """
     Process raw scraped data with Ollama LLM.
     
+    Cards whose content hash matches the previous run (recorded in a
+    manifest next to the output file) reuse the previously extracted card
+    instead of being sent to the LLM again. Text repeated across an
+    issuer's pages is stripped before extraction.
+    
     Args:
-        input_file: Path to raw data JSON file
+        input_file: Raw data file (JSONL, .jsonl.gz or legacy JSON)
         output_file: Path to save processed cards JSON
         model: Ollama model to use (optional)
+        force: Re-extract every card, ignoring the manifest
+        keep_boilerplate: Send page text to the LLM without boilerplate removal
+        config: Concurrency and Ollama server settings
     """
     input_path = get_output_dir() / input_file
     output_path = get_output_dir() / output_file
-    
-    # Load raw data
-    with open(input_path, "r", encoding="utf-8") as f:
-        raw_data_json = json.load(f)
-    
-    raw_cards = [
-        RawCardData(
-            url=item["url"],
-            text_content=item["text_content"],
-            page_title=item["page_title"],
-            issuer=item["issuer"],
-            scraped_at=datetime.fromisoformat(item["scraped_at"]),
-        )
-        for item in raw_data_json
-    ]
-    
-    print(f"\nLoaded {len(raw_cards)} raw card records")
+    manifest_path = output_path.with_suffix(".manifest.json")
+    
+    # Read raw cards one at a time; only those needing extraction are kept
+    manifest = ChangeManifest.load(manifest_path)
+    urls = []
+    reused = {}
+    to_process = []
+    for raw_data in iter_raw_cards(input_path):
+        urls.append(raw_data.url)
+        # Reuse cards whose page content hasn't changed
+        if not force and manifest.mark_unchanged(raw_data):
+            card = manifest.get_card(raw_data)
+            if card:
+                reused[raw_data.url] = card
+                continue
+        to_process.append(raw_data)
+    
+    print(f"\nLoaded {len(urls)} raw card records")
+    print(f"{len(reused)} unchanged cards reused, {len(to_process)} to extract")
     
     # Process with Ollama
-    processor = OllamaProcessor(model=model)
-    cards = processor.process_batch(raw_cards)
+    extracted = {}
+    if to_process:
+        boilerplate = None
+        if not keep_boilerplate:
+            # Learn from every page of each issuer, not just the changed ones
+            boilerplate = BoilerplateFilter().fit(iter_raw_cards(input_path))
+        
+        processor = OllamaProcessor(model=model, boilerplate=boilerplate, config=config)
+        for card in processor.process_batch(to_process):
+            extracted[card.metadata.sourceUrl] = card
+        
+        if processor.cache:
+            print(f"\nLLM cache: {processor.cache.hits} hits, {processor.cache.misses} misses")
+            processor.cache.close()
+        
+        if len(processor.models) > 1:
+            print("\nModel cascade:")
+            for model in processor.models:
+                print(
+                    f"  {model}: {processor.stage_finished[model]} finished, "
+                    f"{processor.stage_escalated[model]} escalated"
+                )
+        
+        if processor.reasks:
+            print(
+                f"\nRe-asked for failing fields {processor.reasks} times; "
+                f"{processor.reask_patched} fields patched"
+            )
+        
+        if processor.repaired_replies:
+            print(f"\nRepaired {processor.repaired_replies} malformed or cut-off replies")
+        
+        if processor.streams_stopped:
+            print(f"\nStopped {processor.streams_stopped} streamed replies as soon as their JSON ended")
+        
+        if processor.rules is not None:
+            print(f"\nRules resolved {processor.rule_fields} fields")
+        
+        if boilerplate and boilerplate.chars_in:
+            saved = 1 - boilerplate.chars_out / boilerplate.chars_in
+            print(f"\nBoilerplate removal cut page text by {saved:.0%}")
+    
+    print(f"\nSuccessfully processed {len(extracted)} cards")
     
-    print(f"\nSuccessfully processed {len(cards)} cards")
+    for raw_data in to_process:
+        manifest.record(raw_data, extracted.get(raw_data.url))
+    cards = []
+    for url in urls:
+        card = reused.get(url) or extracted.get(url)
+        if card:
+            cards.append(card)
+    manifest.save()
     
     # Create CardsData
     cards_data = CardsData(
@@ -268,11 +588,17 @@ def main():
         epilog="""
 Examples:
   python main.py scrape --bank hdfc
-  python main.py scrape --bank all --output raw_all.json
-  python main.py process --input raw_hdfc.json --output cards.json
-  python main.py process --input raw_hdfc.json --output cards.json --model llama3.2
+  python main.py scrape --bank all --output raw_all.jsonl.gz
+  python main.py scrape --bank hdfc --resume
+  python main.py process --input raw_hdfc.jsonl --output cards.json
+  python main.py process --input raw_hdfc.jsonl --output cards.json --model llama3.2
   python main.py validate --input cards.json
   python main.py export --input cards.json --output src/data/cards.json
+  python main.py scrape --bank hdfc --archive
+  python main.py reparse --bank hdfc --output raw_hdfc.jsonl
+  python main.py scrape --bank hdfc --record hdfc.jsonl
+  python main.py scrape --bank hdfc --replay hdfc.jsonl --replay-latency
+  python main.py scrape --bank hdfc --base-url http://127.0.0.1:8765 --no-cache
         """
     )
     
@@ -287,16 +613,96 @@ Examples:
         help="Bank to scrape (or 'all' for all banks)"
     )
     scrape_parser.add_argument(
+        "--output",
+        help="Output file name for raw data (saved in output/, JSONL; gzipped if it ends in .gz)"
+    )
+    scrape_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Keep cards already in the output file and skip their URLs"
+    )
+    scrape_parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Banks scraped in parallel with --bank all (default: 4)"
+    )
+    scrape_parser.add_argument(
+        "--bank-timeout",
+        type=float,
+        default=1800,
+        help="Seconds before a bank's scrape is abandoned with --bank all (default: 1800)"
+    )
+    scrape_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don't use the HTTP cache (output/http_cache.sqlite)"
+    )
+    scrape_parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve pages only from the HTTP cache, without network access"
+    )
+    scrape_parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Store fetched pages in the raw HTML archive (output/archive/)"
+    )
+    cassette_group = scrape_parser.add_mutually_exclusive_group()
+    cassette_group.add_argument(
+        "--record",
+        metavar="CASSETTE",
+        help="Record every request and response to output/cassettes/CASSETTE"
+    )
+    cassette_group.add_argument(
+        "--replay",
+        metavar="CASSETTE",
+        help="Serve responses from output/cassettes/CASSETTE instead of the network"
+    )
+    scrape_parser.add_argument(
+        "--replay-latency",
+        action="store_true",
+        help="With --replay, wait for each response's recorded latency"
+    )
+    scrape_parser.add_argument(
+        "--base-url",
+        help="Scrape this site root instead of the bank's (e.g. benchmarks/mock_bank_server.py)"
+    )
+    
+    # Reparse command
+    reparse_parser = subparsers.add_parser(
+        "reparse", help="Rebuild raw data from the HTML archive without network access"
+    )
+    reparse_parser.add_argument(
+        "--bank",
+        required=True,
+        choices=list(BANK_SCRAPERS.keys()),
+        help="Bank whose archived pages to re-parse"
+    )
+    reparse_parser.add_argument(
         "--output",
         help="Output file name for raw data (saved in output/)"
     )
+    reparse_parser.add_argument(
+        "--as-of",
+        type=datetime.fromisoformat,
+        help="Use pages scraped on or before this time (ISO format)"
+    )
+    
+    # Archive command
+    archive_parser = subparsers.add_parser("archive", help="Show HTML archive statistics")
+    archive_parser.add_argument(
+        "--train",
+        choices=list(BANK_SCRAPERS.keys()) + ["all"],
+        help="Train a zstd compression dictionary from a bank's archived pages"
+    )
     
     # Process command
     process_parser = subparsers.add_parser("process", help="Process raw data with Ollama")
     process_parser.add_argument(
         "--input",
         required=True,
-        help="Input raw data JSON file"
+        help="Input raw data file (JSONL, .jsonl.gz or legacy JSON array)"
     )
     process_parser.add_argument(
         "--output",
@@ -307,6 +713,82 @@ Examples:
         "--model",
         help="Ollama model to use (default: llama3.2)"
     )
+    process_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-extract all cards, even those unchanged since the last run"
+    )
+    process_parser.add_argument(
+        "--keep-boilerplate",
+        action="store_true",
+        help="Don't strip text repeated across an issuer's pages before extraction"
+    )
+    process_parser.add_argument(
+        "--parallel",
+        type=int,
+        default=2,
+        help="Cards extracted at once (default: 2; match OLLAMA_NUM_PARALLEL)"
+    )
+    process_parser.add_argument(
+        "--ollama-host",
+        action="append",
+        dest="ollama_hosts",
+        metavar="URL",
+        help="Ollama server to use; repeat to spread requests over several"
+    )
+    process_parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Don't reuse cached LLM responses (output/llm_cache.sqlite); fresh ones are still cached"
+    )
+    process_parser.add_argument(
+        "--extraction-mode",
+        choices=list(OllamaProcessor.EXTRACTION_MODES),
+        default="chunked",
+        help="chunked: extract long pages in parallel chunks and merge; ranked: only the most "
+             "data-dense sections; sections: each schema slice from its own page sections, in parallel; truncate: first 8000 characters only (default: chunked)"
+    )
+    process_parser.add_argument(
+        "--chunk-tokens",
+        type=int,
+        default=2000,
+        help="Approximate page tokens per prompt in chunked mode (default: 2000)"
+    )
+    process_parser.add_argument(
+        "--context-tokens",
+        type=int,
+        default=1500,
+        help="Token budget for page text in ranked mode, and per prompt in sections mode (default: 1500)"
+    )
+    process_parser.add_argument(
+        "--cascade",
+        nargs="+",
+        metavar="MODEL",
+        help="Models to try from fastest to strongest; a card escalates when its reply "
+             "is unusable, misses required fields or fails validation (overrides --model)"
+    )
+    process_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream replies and stop generation once the JSON object is complete "
+             "or can no longer be valid"
+    )
+    process_parser.add_argument(
+        "--reask",
+        action="store_true",
+        help="Ask again, with only the relevant snippets, for required fields that are "
+             "missing and values the validator flags"
+    )
+    process_parser.add_argument(
+        "--no-rules",
+        action="store_true",
+        help="Ask the LLM for every field instead of filling fixed-pattern fields with regex rules"
+    )
+    process_parser.add_argument(
+        "--free-form",
+        action="store_true",
+        help="Don't constrain replies to the extraction JSON schema (for models or servers without structured output)"
+    )
     
     # Validate command
     validate_parser = subparsers.add_parser("validate", help="Validate cards JSON file")
@@ -332,14 +814,55 @@ Examples:
     args = parser.parse_args()
     
     if args.command == "scrape":
+        config = build_scraper_config(
+            use_cache=not args.no_cache,
+            offline=args.offline,
+            archive=args.archive,
+            record=args.record,
+            replay=args.replay,
+            replay_latency=args.replay_latency,
+            base_url=args.base_url,
+        )
         if args.bank == "all":
-            scrape_all_banks(args.output or "raw_all.json")
+            scrape_all_banks(
+                args.output or "raw_all.jsonl",
+                max_workers=args.workers,
+                bank_timeout=args.bank_timeout,
+                config=config,
+                resume=args.resume,
+            )
         else:
-            output_file = args.output or f"raw_{args.bank}.json"
-            scrape_bank(args.bank, output_file)
+            output_file = args.output or f"raw_{args.bank}.jsonl"
+            scrape_bank(args.bank, output_file, config, resume=args.resume)
+    
+    elif args.command == "reparse":
+        reparse_archive(args.bank, args.output or f"raw_{args.bank}.jsonl", args.as_of)
+    
+    elif args.command == "archive":
+        show_archive(args.train)
     
     elif args.command == "process":
-        process_raw_data(args.input, args.output, args.model)
+        process_raw_data(
+            args.input,
+            args.output,
+            args.model,
+            args.force,
+            args.keep_boilerplate,
+            ProcessorConfig(
+                max_in_flight=args.parallel,
+                hosts=args.ollama_hosts,
+                cache_path=str(get_output_dir() / "llm_cache.sqlite"),
+                cache_bypass=args.no_llm_cache,
+                structured_output=not args.free_form,
+                extraction_mode=args.extraction_mode,
+                chunk_tokens=args.chunk_tokens,
+                context_tokens=args.context_tokens,
+                rules=not args.no_rules,
+                cascade=args.cascade,
+                stream=args.stream,
+                reask=args.reask,
+            ),
+        )
     
     elif args.command == "validate":
         validate_file(args.input)
@@ -17,6 +17,8 @@ from .card_schema import (
     CardType,
     EmploymentType,
     RewardUnit,
+    ExtractedCard,
+    extraction_json_schema,
 )
 
 __all__ = [
@@ -36,4 +38,6 @@ __all__ = [
     "CardType",
     "EmploymentType",
     "RewardUnit",
+    "ExtractedCard",
+    "extraction_json_schema",
 ]
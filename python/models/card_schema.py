@@ -3,10 +3,13 @@ Pydantic models for Credit Card data schema.
 These models match the TypeScript types in the React frontend.
 """
 
-from pydantic import BaseModel, Field, HttpUrl
-from typing import Optional, Literal
+from pydantic import BaseModel, Field, HttpUrl, model_validator
+from typing import Any, Optional, Literal
 from datetime import datetime
 from enum import Enum
+import hashlib
+import re
+import unicodedata
 
 
 class CardNetwork(str, Enum):
@@ -325,6 +328,121 @@ class CardsData(BaseModel):
         }
 
 
+# LLM extraction models: the JSON the model is asked to return, a
+# simplified view of CreditCard that OllamaProcessor builds cards from.
+# Every field is nullable so the model can say "not on the page".
+
+class ExtractedFees(BaseModel):
+    joiningFee: Optional[float] = Field(None, description="Joining fee in INR")
+    joiningFeeWaiver: Optional[str] = Field(None, description="Joining fee waiver condition")
+    annualFee: Optional[float] = Field(None, description="Annual fee in INR")
+    annualFeeWaiver: Optional[str] = Field(None, description="Annual fee waiver condition")
+
+
+class ExtractedEligibility(BaseModel):
+    minSalary: Optional[float] = Field(None, description="Minimum monthly salary in INR")
+    minITR: Optional[float] = Field(None, description="Minimum annual income (ITR) in INR")
+    minCibilScore: Optional[int] = Field(None, description="Minimum CIBIL score")
+    employmentType: list[EmploymentType] = Field(default_factory=list)
+
+
+class ExtractedAcceleratedCategory(BaseModel):
+    category: str
+    rate: Optional[float] = Field(None, description="Reward rate in this category")
+    cap: Optional[float] = Field(None, description="Cap on rewards in this category")
+
+
+class ExtractedWelcomeBonus(BaseModel):
+    points: Optional[float] = None
+    value: Optional[float] = Field(None, description="Value in INR")
+    condition: Optional[str] = None
+
+
+class ExtractedRewards(BaseModel):
+    rewardRate: Optional[float] = Field(None, description="Base reward percentage")
+    rewardUnit: Optional[RewardUnit] = None
+    pointValue: Optional[float] = Field(None, description="INR value per point")
+    acceleratedCategories: list[ExtractedAcceleratedCategory] = Field(default_factory=list)
+    welcomeBonus: Optional[ExtractedWelcomeBonus] = None
+
+
+class ExtractedLoungeTier(BaseModel):
+    freeVisits: Optional[int] = Field(None, description="Free visits per year")
+    program: Optional[str] = None
+
+
+class ExtractedLoungeAccess(BaseModel):
+    domestic: Optional[ExtractedLoungeTier] = None
+    international: Optional[ExtractedLoungeTier] = None
+
+
+class ExtractedCharges(BaseModel):
+    interestRateAnnual: Optional[float] = Field(None, description="Annual interest rate, percent")
+    foreignTxnFee: Optional[float] = Field(None, description="Foreign currency markup, percent")
+    lateFee: Optional[float] = Field(None, description="Late payment fee in INR")
+    cashAdvanceFeePercent: Optional[float] = None
+    cashAdvanceFeeMin: Optional[float] = Field(None, description="Minimum cash advance fee in INR")
+
+
+class ExtractedFeatures(BaseModel):
+    contactless: Optional[bool] = None
+    concierge: Optional[bool] = None
+    airAccidentCover: Optional[float] = Field(None, description="Air accident cover in INR")
+    lostCardCover: Optional[float] = Field(None, description="Lost card liability cover in INR")
+
+
+class ExtractedCard(BaseModel):
+    """Card details as extracted by the LLM."""
+    
+    name: Optional[str] = Field(None, description="Full card name")
+    cardType: Optional[CardType] = None
+    network: list[CardNetwork] = Field(default_factory=list)
+    fees: ExtractedFees = Field(default_factory=ExtractedFees)
+    eligibility: ExtractedEligibility = Field(default_factory=ExtractedEligibility)
+    rewards: ExtractedRewards = Field(default_factory=ExtractedRewards)
+    loungeAccess: ExtractedLoungeAccess = Field(default_factory=ExtractedLoungeAccess)
+    charges: ExtractedCharges = Field(default_factory=ExtractedCharges)
+    features: ExtractedFeatures = Field(default_factory=ExtractedFeatures)
+
+
+def _inline_refs(schema: Any, defs: dict) -> Any:
+    """Replace $ref pointers into $defs with the definitions themselves."""
+    if isinstance(schema, dict):
+        if "$ref" in schema:
+            return _inline_refs(defs[schema["$ref"].split("/")[-1]], defs)
+        return {
+            key: _inline_refs(value, defs)
+            for key, value in schema.items()
+            if key != "$defs"
+        }
+    if isinstance(schema, list):
+        return [_inline_refs(item, defs) for item in schema]
+    return schema
+
+
+def extraction_json_schema(model: type[BaseModel] = ExtractedCard) -> dict:
+    """
+    JSON schema for constraining LLM output (Ollama's `format`).
+    
+    References are inlined, since grammar-based decoders handle a single
+    self-contained schema most reliably.
+    """
+    schema = model.model_json_schema()
+    return _inline_refs(schema, schema.get("$defs", {}))
+
+
+def content_hash(text: str) -> str:
+    """
+    Stable hash of page text, ignoring whitespace and Unicode form changes.
+    
+    Used to detect card pages that are unchanged since the previous run.
+    """
+    normalized = unicodedata.normalize("NFKC", text)
+    lines = (re.sub(r"\s+", " ", line).strip() for line in normalized.splitlines())
+    normalized = "\n".join(line for line in lines if line)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
 # Raw data model for scraper output (before LLM processing)
 class RawCardData(BaseModel):
     """Raw scraped data before LLM processing."""
@@ -335,6 +453,14 @@ class RawCardData(BaseModel):
     page_title: str
     issuer: str
     scraped_at: datetime = Field(default_factory=datetime.now)
+    content_hash: Optional[str] = None  # Filled from text_content if not given
+    unchanged: bool = False  # Same content as the previous run
     
     class Config:
         populate_by_name = True
+    
+    @model_validator(mode="after")
+    def _fill_content_hash(self):
+        if self.content_hash is None:
+            self.content_hash = content_hash(self.text_content)
+        return self
@@ -1,6 +1,18 @@
 """Data processors for credit card extraction."""
 
-from .ollama_processor import OllamaProcessor
+from .boilerplate import BoilerplateFilter
+from .llm_cache import LLMCache
+from .manifest import ChangeManifest
+from .ollama_processor import OllamaProcessor, ProcessorConfig
+from .rules import RuleExtractor
 from .schema_validator import SchemaValidator
 
-__all__ = ["OllamaProcessor", "SchemaValidator"]
+__all__ = [
+    "BoilerplateFilter",
+    "ChangeManifest",
+    "LLMCache",
+    "OllamaProcessor",
+    "ProcessorConfig",
+    "RuleExtractor",
+    "SchemaValidator",
+]
@@ -0,0 +1,158 @@
+"""
+Cross-page boilerplate removal.
+Learns which lines an issuer repeats on most of its card pages (menus,
+disclaimers, cookie banners, footers) and strips them from page text
+before LLM extraction, leaving more of the prompt for card content.
+"""
+
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Iterable
+
+from models import RawCardData
+
+
+# Structure added by the scrapers, never treated as boilerplate
+STRUCTURAL_LINE = re.compile(r"^(## |--- )")
+
+# Lines with amounts, rates or limits may be card facts shared by every
+# card (e.g. the same late fee), so they are always kept
+CARD_FACT = re.compile(
+    r"₹|\brs\b|\binr\b|%|\d+\s*(?:-\s*\d+\s*)?(?:years?|months?|days?|points?|visits?|x)\b"
+)
+
+
+def _normalize(line: str) -> str:
+    return re.sub(r"\s+", " ", line).strip().lower()
+
+
+class BoilerplateFilter:
+    """
+    Per-issuer boilerplate model built from line and shingle frequency.
+
+    A line is boilerplate for an issuer when it appears on at least
+    `line_threshold` of that issuer's pages. Longer lines that differ only
+    slightly between pages (a disclaimer naming each card) are caught by
+    word shingles: the line goes when most of its shingles are that common.
+    Short repeated lines (labels such as "Joining Fee") are only removed as
+    part of a run of boilerplate lines, like a menu.
+    """
+
+    def __init__(
+        self,
+        min_pages: int = 5,
+        line_threshold: float = 0.6,
+        shingle_size: int = 5,
+        shingle_coverage: float = 0.8,
+        min_words: int = 4,
+        min_run: int = 3,
+    ):
+        """
+        Args:
+            min_pages: Issuers with fewer pages are left unfiltered
+            line_threshold: Fraction of an issuer's pages a line (or
+                shingle) must appear on to count as boilerplate
+            shingle_size: Words per shingle
+            shingle_coverage: Fraction of a line's shingles that must be
+                boilerplate for the line to be removed
+            min_words: Shorter lines are kept unless part of a run
+            min_run: Consecutive boilerplate lines that are removed even
+                when short
+        """
+        self.min_pages = min_pages
+        self.line_threshold = line_threshold
+        self.shingle_size = shingle_size
+        self.shingle_coverage = shingle_coverage
+        self.min_words = min_words
+        self.min_run = min_run
+
+        self._pages: Counter = Counter()
+        self._line_counts: dict[str, Counter] = defaultdict(Counter)
+        self._shingle_counts: dict[str, Counter] = defaultdict(Counter)
+        self.chars_in = 0
+        self.chars_out = 0
+        self._stats_lock = threading.Lock()
+
+    def _shingles(self, words: list[str]) -> list[int]:
+        size = self.shingle_size
+        return [hash(" ".join(words[i:i + size])) for i in range(len(words) - size + 1)]
+
+    def add_page(self, issuer: str, text: str):
+        """Count one page's lines and shingles towards its issuer's model."""
+        lines = {_normalize(line) for line in text.splitlines()}
+        lines.discard("")
+        shingles = set()
+        for line in lines:
+            shingles.update(self._shingles(line.split()))
+
+        self._pages[issuer] += 1
+        self._line_counts[issuer].update(hash(line) for line in lines)
+        self._shingle_counts[issuer].update(shingles)
+
+    def fit(self, raw_cards: Iterable[RawCardData]) -> "BoilerplateFilter":
+        """Build the model from scraped pages (may be a lazy iterator)."""
+        for raw_data in raw_cards:
+            self.add_page(raw_data.issuer, raw_data.text_content)
+        return self
+
+    def _is_candidate(self, issuer: str, line: str, min_count: float) -> bool:
+        """Whether a normalized line is common enough to be boilerplate."""
+        if self._line_counts[issuer][hash(line)] >= min_count:
+            return True
+        shingles = self._shingles(line.split())
+        if not shingles:
+            return False
+        common = sum(
+            1 for shingle in shingles
+            if self._shingle_counts[issuer][shingle] >= min_count
+        )
+        return common >= self.shingle_coverage * len(shingles)
+
+    def clean(self, issuer: str, text: str) -> str:
+        """
+        Remove the issuer's boilerplate lines from page text.
+
+        Returns the text unchanged if the issuer has too few pages.
+        """
+        pages = self._pages[issuer]
+        if pages < self.min_pages:
+            self._count(text, text)
+            return text
+        min_count = max(2, self.line_threshold * pages)
+
+        lines = text.splitlines()
+        candidate = []
+        for line in lines:
+            normalized = _normalize(line)
+            candidate.append(
+                bool(normalized)
+                and not STRUCTURAL_LINE.match(line.strip())
+                and not CARD_FACT.search(normalized)
+                and self._is_candidate(issuer, normalized, min_count)
+            )
+
+        # Short candidates only go when they are part of a run
+        remove = list(candidate)
+        i = 0
+        while i < len(lines):
+            if not candidate[i]:
+                i += 1
+                continue
+            run_end = i
+            while run_end < len(lines) and candidate[run_end]:
+                run_end += 1
+            if run_end - i < self.min_run:
+                for j in range(i, run_end):
+                    if len(lines[j].split()) < self.min_words:
+                        remove[j] = False
+            i = run_end
+
+        cleaned = "\n".join(line for line, drop in zip(lines, remove) if not drop)
+        self._count(text, cleaned)
+        return cleaned
+
+    def _count(self, text: str, cleaned: str):
+        with self._stats_lock:
+            self.chars_in += len(text)
+            self.chars_out += len(cleaned)
@@ -0,0 +1,206 @@
+"""
+Token-aware chunking and merging for long card pages.
+Long pages are split into chunks that each fit the extraction prompt,
+every chunk is extracted separately, and the partial results are merged
+field by field, so content near the end of a page is not cut off.
+"""
+
+import json
+import math
+import re
+from collections import Counter
+from typing import Any, Optional
+
+
+# Lines that start a new section; preferred places to split
+SECTION_START = re.compile(r"^(## |--- )")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count for Llama-family tokenizers.
+
+    About four characters per token for English prose; numbers and
+    punctuation-heavy text tokenize denser, so words are counted too.
+    """
+    return max(math.ceil(len(text) / 4), math.ceil(len(text.split()) * 1.3))
+
+
+def _split_long_line(line: str, max_tokens: int) -> list[str]:
+    """Split a line that alone exceeds the budget, at word boundaries."""
+    pieces, current = [], []
+    for word in line.split():
+        if current and estimate_tokens(" ".join(current + [word])) > max_tokens:
+            pieces.append(" ".join(current))
+            current = []
+        current.append(word)
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+def chunk_text(text: str, max_tokens: int, overlap_lines: int = 2) -> list[str]:
+    """
+    Split text into chunks of at most about `max_tokens` tokens.
+
+    Chunks end at line boundaries, preferably just before a section
+    header. A chunk that has to end mid-section passes its last
+    `overlap_lines` lines on to the next one, so a label and its value
+    are not separated.
+
+    Returns:
+        [text] if it already fits
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return [text]
+
+    lines, chunks = _chunk_lines(text, max_tokens, overlap_lines)
+    if _lost_lines(lines, chunks):
+        # Shouldn't happen; extract what fits rather than fail the card
+        print("Warning: chunking lost lines, using one truncated chunk instead")
+        return [text[:max_tokens * 4]]
+    return ["\n".join(lines[i] for i in chunk) for chunk in chunks]
+
+
+def _chunk_lines(text: str, max_tokens: int, overlap_lines: int) -> tuple[list[str], list[list[int]]]:
+    """
+    Split text into lines and group them into chunks.
+
+    Returns:
+        (lines, chunks as lists of line indices)
+    """
+    lines = []
+    for line in text.splitlines():
+        if estimate_tokens(line) > max_tokens:
+            lines.extend(_split_long_line(line, max_tokens))
+        else:
+            lines.append(line)
+
+    # Chunks hold indices into `lines`, so coverage can be checked
+    chunks: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+    # Position in `current` of the last section header, a better split point
+    last_section = None
+
+    def tokens_of(indices: list[int]) -> int:
+        return sum(estimate_tokens(lines[i]) + 1 for i in indices)
+
+    for index, line in enumerate(lines):
+        tokens = estimate_tokens(line) + 1
+        if current and current_tokens + tokens > max_tokens:
+            if last_section:
+                # Split before the last section header; no overlap needed
+                chunks.append(current[:last_section])
+                current = current[last_section:]
+                if tokens_of(current) + tokens > max_tokens:
+                    # The section so far fills a chunk of its own
+                    chunks.append(current)
+                    current = []
+            else:
+                chunks.append(current)
+                current = current[-overlap_lines:] if overlap_lines else []
+                # Drop carried (already chunked) lines until the new line fits
+                while current and tokens_of(current) + tokens > max_tokens:
+                    current.pop(0)
+            current_tokens = tokens_of(current)
+            last_section = None
+        if SECTION_START.match(line) and current:
+            last_section = len(current)
+        current.append(index)
+        current_tokens += tokens
+
+    if current:
+        chunks.append(current)
+    return lines, [chunk for chunk in chunks if chunk]
+
+
+def _lost_lines(lines: list[str], chunks: list[list[int]]) -> list[int]:
+    """Indices of lines that ended up in no chunk."""
+    covered = set()
+    for chunk in chunks:
+        covered.update(chunk)
+    return [i for i in range(len(lines)) if i not in covered]
+
+
+def _value_key(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False)
+
+
+def _list_item_key(item: Any) -> str:
+    # Accelerated categories are the same entry when they name the same category
+    if isinstance(item, dict) and isinstance(item.get("category"), str):
+        return "category:" + item["category"].strip().lower()
+    return _value_key(item)
+
+
+def merge_extractions(parts: list[dict]) -> dict:
+    """
+    Deterministically merge partial extractions, field by field.
+
+    - Objects are merged key by key.
+    - Lists are combined in order, without duplicates.
+    - For any other field, the value most chunks agree on wins; ties go
+      to the earliest chunk.
+    Missing and null fields never override values that were found.
+    """
+    return _merge_values([part for part in parts if part is not None]) or {}
+
+
+def _merge_values(values: list[Any]) -> Optional[Any]:
+    values = [value for value in values if value is not None]
+    if not values:
+        return None
+
+    if all(isinstance(value, dict) for value in values):
+        keys = []
+        for value in values:
+            for key in value:
+                if key not in keys:
+                    keys.append(key)
+        merged = {}
+        for key in keys:
+            value = _merge_values([part.get(key) for part in values])
+            if value is not None:
+                merged[key] = value
+        return merged
+
+    if all(isinstance(value, list) for value in values):
+        merged, seen = [], set()
+        for value in values:
+            for item in value:
+                key = _list_item_key(item)
+                if key not in seen:
+                    seen.add(key)
+                    merged.append(item)
+        return merged
+
+    counts = Counter(_value_key(value) for value in values)
+    best = max(counts.values())
+    return next(value for value in values if counts[_value_key(value)] == best)
+
+
+if __name__ == "__main__":
+    import random
+
+    # Every line must land in some chunk, whatever the page looks like
+    rng = random.Random(0)
+    words = ["fee", "₹500", "annual", "reward", "points", "lounge", "visa", "interest"]
+    failures = 0
+    for _ in range(2000):
+        page = []
+        for _ in range(rng.randint(1, 60)):
+            kind = rng.random()
+            if kind < 0.15:
+                page.append("## " + rng.choice(words).title())
+            elif kind < 0.2:
+                page.append("")
+            else:
+                page.append(" ".join(rng.choices(words, k=rng.randint(1, 80))))
+        text = "\n".join(page)
+        max_tokens = rng.randint(20, 300)
+        lines, chunks = _chunk_lines(text, max_tokens, rng.randint(0, 3))
+        if _lost_lines(lines, chunks):
+            failures += 1
+            print(f"✗ lost lines with max_tokens={max_tokens}:\n{text}\n")
+    print("✓ every line covered" if not failures else f"✗ {failures} pages lost lines")
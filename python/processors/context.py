@@ -0,0 +1,225 @@
+"""
+Relevance-ranked context selection for extraction prompts.
+Scores a page's sections and paragraphs by how much extractable card data
+they hold (fee, reward, lounge, eligibility and interest keywords, plus
+amounts and percentages) and packs the best of them into a token budget.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable
+
+from .chunking import estimate_tokens
+
+
+# Keywords per extraction topic; a block's score counts distinct hits
+TOPIC_KEYWORDS = {
+    "fees": ["joining fee", "annual fee", "renewal fee", "membership fee", "waiver", "waived", "gst"],
+    "charges": [
+        "interest", "per month", "per annum", "finance charge", "late payment", "late fee",
+        "markup", "foreign currency", "cash advance", "over limit", "charges",
+    ],
+    "rewards": [
+        "reward", "points", "cashback", "cash back", "miles", "accelerated", "milestone",
+        "welcome", "redeem", "redemption", "per rs", "spent",
+    ],
+    "lounge": ["lounge", "airport", "priority pass", "complimentary visits", "railway"],
+    "eligibility": [
+        "eligibility", "salaried", "self-employed", "self employed", "income", "itr",
+        "age", "cibil", "credit score", "nationality", "resident",
+    ],
+    "features": ["contactless", "concierge", "insurance", "cover", "lost card", "golf", "network"],
+}
+
+_KEYWORD_PATTERNS = {
+    topic: re.compile("|".join(r"\b" + re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+    for topic, keywords in TOPIC_KEYWORDS.items()
+}
+
+# Amounts, percentages and counts: the values extraction is after
+NUMERIC_TOKEN = re.compile(
+    r"(?:₹|rs\.?|inr)\s*[\d,]+(?:\.\d+)?|\d+(?:\.\d+)?\s*%|\b\d[\d,]*(?:\.\d+)?\b",
+    re.IGNORECASE,
+)
+
+# Extraction fields' top-level keys, and the topic that covers each
+FIELD_TOPICS = {
+    "fees": "fees",
+    "charges": "charges",
+    "rewards": "rewards",
+    "loungeAccess": "lounge",
+    "eligibility": "eligibility",
+    "features": "features",
+}
+NETWORK_KEYWORDS = ["visa", "mastercard", "rupay", "american express", "amex", "diners"]
+
+SECTION_HEADER = re.compile(r"^## ")
+STRUCTURED_MARKER = "--- STRUCTURED SECTIONS ---"
+
+
+@dataclass
+class ContextBlock:
+    """A section or paragraph of page text, with its place on the page."""
+
+    index: int
+    text: str
+    tokens: int
+    score: float = 0.0
+
+
+def split_blocks(text: str, max_block_tokens: int = 300) -> list[str]:
+    """
+    Split page text into sections and paragraphs.
+
+    Scraper-extracted sections ("## Header" blocks) stay whole where they
+    fit; other text is grouped into runs of lines of up to
+    `max_block_tokens` tokens.
+    """
+    blocks: list[str] = []
+    current: list[str] = []
+    current_tokens = 0
+
+    def flush():
+        nonlocal current, current_tokens
+        if current:
+            blocks.append("\n".join(current))
+        current, current_tokens = [], 0
+
+    for line in text.splitlines():
+        if not line.strip() or line.strip() == STRUCTURED_MARKER:
+            continue
+        if SECTION_HEADER.match(line):
+            flush()
+        tokens = estimate_tokens(line) + 1
+        if current and current_tokens + tokens > max_block_tokens:
+            flush()
+        current.append(line)
+        current_tokens += tokens
+    flush()
+    return blocks
+
+
+def score_block(text: str) -> float:
+    """
+    Relevance of a block to card extraction.
+
+    Distinct topics and keyword hits count most; numeric tokens (amounts,
+    rates, counts) add value. Normalized by length so long blocks of prose
+    don't win on volume alone.
+    """
+    topics = 0
+    hits = 0
+    for pattern in _KEYWORD_PATTERNS.values():
+        found = len(pattern.findall(text))
+        if found:
+            topics += 1
+            hits += found
+    numbers = len(NUMERIC_TOKEN.findall(text))
+    if not hits and not numbers:
+        return 0.0
+
+    tokens = max(1, estimate_tokens(text))
+    density = (2 * hits + numbers) / tokens
+    score = topics + 10 * density
+    if SECTION_HEADER.match(text):
+        # Sections the scraper picked out by header are usually the core data
+        score += 1
+    return score
+
+
+def field_keywords(path: tuple[str, ...]) -> list[str]:
+    """
+    Words that text about an extraction field is likely to contain.
+
+    The words of the field's own name (e.g. "cibil" and "score" for
+    eligibility.minCibilScore) come first, then its topic's keywords.
+    """
+    if path[0] == "network":
+        return list(NETWORK_KEYWORDS)
+    if path[0] == "name":
+        return ["credit card"]
+    words = [
+        word.lower()
+        for word in re.findall(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+", path[-1])
+        if len(word) > 2 and word.lower() not in ("min", "max")
+    ]
+    topic = FIELD_TOPICS.get(path[0])
+    if topic:
+        words.extend(keyword for keyword in TOPIC_KEYWORDS[topic] if keyword not in words)
+    return words
+
+
+def select_context(text: str, token_budget: int, max_block_tokens: int = 300) -> str:
+    """
+    Pack the most relevant blocks of a page into a token budget.
+
+    Blocks are taken in order of score until the budget is full, then put
+    back in page order so the model reads them as they appeared. Blocks
+    with no keywords or numbers are never included.
+
+    Returns:
+        The whole text if it already fits
+    """
+    if estimate_tokens(text) <= token_budget:
+        return text
+    return _pack(text, token_budget, max_block_tokens, score_block)
+
+
+def select_for_keywords(
+    text: str,
+    keywords: list[str],
+    token_budget: int,
+    max_block_tokens: int = 150,
+) -> str:
+    """
+    Pack the blocks that best match specific keywords into a token budget.
+
+    Used to ask about a few fields: only blocks mentioning at least one
+    keyword are included, densest first.
+    """
+    if not keywords:
+        return ""
+    pattern = re.compile(
+        "|".join(r"\b" + re.escape(keyword) for keyword in keywords),
+        re.IGNORECASE,
+    )
+
+    def score(block: str) -> float:
+        hits = len(pattern.findall(block))
+        if not hits:
+            return 0.0
+        numbers = len(NUMERIC_TOKEN.findall(block))
+        return (2 * hits + numbers) / max(1, estimate_tokens(block))
+
+    return _pack(text, token_budget, max_block_tokens, score)
+
+
+def _pack(
+    text: str,
+    token_budget: int,
+    max_block_tokens: int,
+    score: Callable[[str], float],
+) -> str:
+    blocks = [
+        ContextBlock(index=i, text=block, tokens=estimate_tokens(block) + 1)
+        for i, block in enumerate(split_blocks(text, max_block_tokens))
+    ]
+    for block in blocks:
+        block.score = score(block.text)
+
+    chosen: list[ContextBlock] = []
+    used = 0
+    seen: set[str] = set()
+    for block in sorted(blocks, key=lambda block: (-block.score, block.index)):
+        if block.score <= 0:
+            break
+        # Sections are often repeated verbatim in the structured block
+        key = re.sub(r"\s+", " ", block.text).strip().lower()
+        if key in seen or used + block.tokens > token_budget:
+            continue
+        seen.add(key)
+        chosen.append(block)
+        used += block.tokens
+
+    chosen.sort(key=lambda block: block.index)
+    return "\n".join(block.text for block in chosen)
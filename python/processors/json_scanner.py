@@ -0,0 +1,275 @@
+"""
+Incremental, string-aware JSON object scanner.
+Follows LLM output character by character, tracking strings and bracket
+nesting, to tell when the top-level JSON object is complete or when the
+output can no longer become valid JSON. Used to stop streamed generation
+early, and to find and repair the JSON objects in a finished reply.
+"""
+
+import json
+import re
+from typing import Any, Iterator, Optional
+
+
+# Scanner states
+WAITING = "waiting"  # No object started yet
+IN_OBJECT = "in_object"
+COMPLETE = "complete"  # The top-level object has closed
+FAILED = "failed"  # The output can't become the expected object
+
+CLOSERS = {"{": "}", "[": "]"}
+
+
+class JsonScanner:
+    """
+    Tracks the first top-level JSON object in text fed piece by piece.
+
+    Runs in linear time over the text: each character is looked at once.
+    """
+
+    def __init__(self, max_preamble: Optional[int] = 2000):
+        """
+        Args:
+            max_preamble: Characters allowed before the object starts (a
+                model explaining itself first); None for no limit
+        """
+        self.max_preamble = max_preamble
+        self.state = WAITING
+        self.buffer: list[str] = []
+        self.length = 0
+        self.start: Optional[int] = None
+        self.end: Optional[int] = None
+        self.reason: Optional[str] = None
+        # Open brackets, innermost last
+        self.stack: list[str] = []
+        self.in_string = False
+        self.escaped = False
+
+    @property
+    def done(self) -> bool:
+        """Whether more text can't change the outcome."""
+        return self.state in (COMPLETE, FAILED)
+
+    def feed(self, text: str) -> str:
+        """
+        Scan the next piece of output.
+
+        Returns:
+            The scanner's state afterwards
+        """
+        if self.done:
+            return self.state
+        self.buffer.append(text)
+        for offset, char in enumerate(text):
+            self._step(char, self.length + offset)
+            if self.done:
+                break
+        self.length += len(text)
+        if self.state == WAITING and self.max_preamble is not None and self.length > self.max_preamble:
+            self._fail(f"no JSON object in the first {self.max_preamble} characters")
+        return self.state
+
+    def _step(self, char: str, position: int):
+        if self.state == WAITING:
+            if char == "{":
+                self.state = IN_OBJECT
+                self.start = position
+                self.stack.append("{")
+            return
+
+        if self.in_string:
+            if self.escaped:
+                self.escaped = False
+            elif char == "\\":
+                self.escaped = True
+            elif char == '"':
+                self.in_string = False
+            return
+
+        if char == '"':
+            self.in_string = True
+        elif char in CLOSERS:
+            self.stack.append(char)
+        elif char in ("}", "]"):
+            if CLOSERS[self.stack[-1]] != char:
+                self._fail(f"unexpected '{char}' at position {position}")
+                return
+            self.stack.pop()
+            if not self.stack:
+                self.state = COMPLETE
+                self.end = position + 1
+
+    def _fail(self, reason: str):
+        self.state = FAILED
+        self.reason = reason
+
+    @property
+    def text(self) -> str:
+        """Everything fed so far."""
+        return "".join(self.buffer)
+
+    @property
+    def object_text(self) -> Optional[str]:
+        """The complete top-level object, once there is one."""
+        if self.state != COMPLETE:
+            return None
+        return self.text[self.start:self.end]
+
+
+def iter_json_candidates(text: str) -> Iterator[tuple[str, bool]]:
+    """
+    Find top-level JSON objects in text, in one pass.
+
+    Text outside objects (explanations, markdown fences) is skipped. After
+    a mismatched bracket, scanning resumes just past it.
+
+    Yields:
+        (object text, whether it is complete); only the last can be
+        incomplete, when the text ends inside an object
+    """
+    scanner = JsonScanner(max_preamble=None)
+    for position, char in enumerate(text):
+        scanner._step(char, position)
+        if scanner.state == COMPLETE:
+            yield text[scanner.start:scanner.end], True
+            scanner = JsonScanner(max_preamble=None)
+        elif scanner.state == FAILED:
+            scanner = JsonScanner(max_preamble=None)
+    if scanner.state == IN_OBJECT:
+        yield text[scanner.start:], False
+
+
+# A bare JSON value: number or literal
+BARE_VALUE = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null")
+BARE_CHARS = set("0123456789+-.eEtrufalsn")
+
+
+def repair_json(text: str) -> Optional[Any]:
+    """
+    Parse a JSON object that may be cut off or have trailing commas.
+
+    Trailing commas are dropped and missing commas between values are
+    added. Output that stops mid-way (e.g. at the
+    num_predict limit) or turns into something that isn't JSON is cut
+    back to the last complete value, dropping the dangling field, and
+    the open objects and arrays are closed.
+
+    Returns:
+        The parsed value, or None if nothing could be salvaged
+    """
+    out: list[str] = []
+    # Open containers: [bracket, expecting a key (objects only)]
+    stack: list[list] = []
+    # (length of out, closers) where the output could end validly
+    safe: Optional[tuple[int, str]] = None
+    in_string = escaped = string_is_key = False
+    # A value just ended, so the next one needs a comma first
+    after_value = False
+    bare: list[str] = []
+
+    def closers() -> str:
+        return "".join(CLOSERS[frame[0]] for frame in reversed(stack))
+
+    def value_done():
+        nonlocal safe, after_value
+        if stack and stack[-1][0] == "{":
+            stack[-1][1] = False
+        safe = (len(out), closers())
+        after_value = True
+
+    def value_start():
+        nonlocal after_value
+        if after_value:
+            out.append(",")
+            if stack[-1][0] == "{":
+                stack[-1][1] = True
+        after_value = False
+
+    def end_bare() -> bool:
+        """Finish a number or literal; False if it isn't valid JSON."""
+        token = "".join(bare)
+        bare.clear()
+        if not BARE_VALUE.fullmatch(token):
+            return False
+        out.append(token)
+        value_done()
+        return True
+
+    def strip_trailing_comma():
+        while out and out[-1].isspace():
+            out.pop()
+        if out and out[-1] == ",":
+            out.pop()
+
+    for char in text:
+        if in_string:
+            out.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+                if not string_is_key:
+                    value_done()
+            continue
+
+        if bare and char not in BARE_CHARS:
+            if not end_bare():
+                break
+        if char in BARE_CHARS:
+            if not bare:
+                value_start()
+            bare.append(char)
+        elif char == '"':
+            value_start()
+            in_string = True
+            string_is_key = bool(stack) and stack[-1][0] == "{" and stack[-1][1]
+            out.append(char)
+        elif char in CLOSERS:
+            if not stack and out:
+                break
+            if stack:
+                value_start()
+            out.append(char)
+            stack.append([char, char == "{"])
+            safe = (len(out), closers())
+        elif char in ("}", "]"):
+            if not stack or CLOSERS[stack[-1][0]] != char:
+                break
+            strip_trailing_comma()
+            out.append(char)
+            stack.pop()
+            after_value = False
+            if not stack:
+                return _loads("".join(out))
+            value_done()
+        elif char == ",":
+            if stack and stack[-1][0] == "{":
+                stack[-1][1] = True
+            after_value = False
+            out.append(char)
+        elif char == ":":
+            if stack and stack[-1][0] == "{":
+                stack[-1][1] = False
+            out.append(char)
+        elif char.isspace():
+            out.append(char)
+        else:
+            break
+
+    # A number still being read when the text ends may be cut off, and is
+    # dropped with the rest of the unfinished output
+    if safe is None:
+        return None
+    length, closing = safe
+    del out[length:]
+    strip_trailing_comma()
+    return _loads("".join(out) + closing)
+
+
+def _loads(text: str) -> Optional[Any]:
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return None
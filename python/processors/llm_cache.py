@@ -0,0 +1,119 @@
+"""
+Persistent cache of LLM responses.
+Extraction runs at a low temperature, so the same model, prompt and
+options give effectively the same answer; caching the raw responses makes
+re-running processing (e.g. after changing how cards are built or
+validated) near-instant.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Optional
+
+
+class LLMCache:
+    """
+    SQLite-backed store of raw LLM responses keyed by a request hash.
+
+    Entries older than `max_age_days` are not served, and the least
+    recently used entries beyond `max_entries` are evicted. Safe to share
+    between the worker threads of one processor.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: Optional[int] = 10000,
+        max_age_days: Optional[float] = 30,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_age = timedelta(days=max_age_days) if max_age_days else None
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    used_at TEXT NOT NULL
+                )
+                """
+            )
+        self.evict()
+
+    @staticmethod
+    def key(model: str, prompt: str, options: dict, format: Any = None) -> str:
+        """Hash of everything that determines a response."""
+        request = json.dumps(
+            {"model": model, "prompt": prompt, "options": options, "format": format},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a cached response, or None if missing or too old."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            fresh = row is not None and not (
+                self.max_age
+                and datetime.now() - datetime.fromisoformat(row[1]) > self.max_age
+            )
+            if not fresh:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE responses SET used_at = ? WHERE key = ?",
+                    (datetime.now().isoformat(), key),
+                )
+            return row[0]
+
+    def put(self, key: str, model: str, response: str):
+        """Store (or replace) a response."""
+        now = datetime.now().isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO responses (key, model, response, created_at, used_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (key, model, response, now, now),
+            )
+
+    def evict(self):
+        """Drop expired entries and the least recently used beyond max_entries."""
+        with self._lock, self._conn:
+            if self.max_age:
+                cutoff = (datetime.now() - self.max_age).isoformat()
+                self._conn.execute("DELETE FROM responses WHERE created_at < ?", (cutoff,))
+            if self.max_entries:
+                self._conn.execute(
+                    """
+                    DELETE FROM responses WHERE key NOT IN (
+                        SELECT key FROM responses ORDER BY used_at DESC LIMIT ?
+                    )
+                    """,
+                    (self.max_entries,),
+                )
+
+    def close(self):
+        self.evict()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,85 @@
+"""
+Change manifest for incremental processing.
+Remembers each card page's content hash and the CreditCard extracted from
+it, so pages that have not changed since the last run skip LLM extraction.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from models import CreditCard, RawCardData
+
+
+class ChangeManifest:
+    """
+    Content hashes and extracted cards from a previous processing run,
+    keyed by source URL.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path, entries: Optional[dict[str, dict]] = None):
+        self.path = Path(path)
+        self.entries: dict[str, dict] = entries or {}
+
+    @classmethod
+    def load(cls, path: Path) -> "ChangeManifest":
+        """Load a manifest, or start an empty one if the file doesn't exist."""
+        path = Path(path)
+        if not path.exists():
+            return cls(path)
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        if data.get("version") != cls.VERSION:
+            print(f"Ignoring manifest with unsupported version: {path}")
+            return cls(path)
+
+        return cls(path, data.get("cards", {}))
+
+    def mark_unchanged(self, raw_data: RawCardData) -> bool:
+        """
+        Set raw_data.unchanged if its content matches the previous run.
+
+        Returns:
+            True if a previously extracted card can be reused
+        """
+        entry = self.entries.get(raw_data.url)
+        raw_data.unchanged = bool(
+            entry
+            and entry.get("content_hash") == raw_data.content_hash
+            and entry.get("card") is not None
+        )
+        return raw_data.unchanged
+
+    def get_card(self, raw_data: RawCardData) -> Optional[CreditCard]:
+        """Get the card extracted from this page in the previous run."""
+        entry = self.entries.get(raw_data.url)
+        if not entry or entry.get("card") is None:
+            return None
+        try:
+            return CreditCard(**entry["card"])
+        except Exception as e:
+            print(f"Stale manifest entry for {raw_data.url}: {e}")
+            return None
+
+    def record(self, raw_data: RawCardData, card: Optional[CreditCard]):
+        """Remember the content hash and extraction result for a page."""
+        self.entries[raw_data.url] = {
+            "content_hash": raw_data.content_hash,
+            "card": card.to_frontend_json() if card else None,
+            "processed_at": datetime.now().isoformat(),
+        }
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": self.VERSION, "cards": self.entries},
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
@@ -3,9 +3,15 @@ Ollama LLM processor for converting raw scraped data to structured JSON.
 Uses local Ollama models to extract credit card details from unstructured text.
 """
 
+import copy
+import itertools
 import json
 import re
-from typing import Optional
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Optional
 from datetime import datetime
 
 try:
@@ -13,6 +19,8 @@ try:
 except ImportError:
     ollama = None
 
+from pydantic import ValidationError
+
 from models import (
     CreditCard,
     RawCardData,
@@ -29,6 +37,8 @@ from models import (
     CardType,
     EmploymentType,
     RewardUnit,
+    ExtractedCard,
+    extraction_json_schema,
 )
 from models.card_schema import (
     FuelSurchargeWaiver,
@@ -37,6 +47,21 @@ from models.card_schema import (
     EMIFee,
     InsuranceCover,
 )
+from .boilerplate import BoilerplateFilter
+from .chunking import chunk_text, merge_extractions
+from .context import field_keywords, select_context, select_for_keywords
+from .json_scanner import FAILED, JsonScanner, iter_json_candidates, repair_json
+from .llm_cache import LLMCache
+from .rules import (
+    REQUIRED_FIELDS,
+    RuleExtractor,
+    apply_matches,
+    prune_schema,
+    prune_schema_text,
+    schema_fields,
+)
+from .schema_validator import SchemaValidator
+from .sections import SectionTask, plan_section_tasks
 
 
 # JSON Schema for LLM extraction (simplified for prompt)
@@ -108,6 +133,82 @@ ISSUER: {issuer}
 
 Respond with ONLY valid JSON, no explanations or markdown. Start with {{ and end with }}"""
 
+REASK_PROMPT = """Some details of the {card_name} credit card ({issuer}) are missing or look wrong. Find them in the text below.
+
+FIELDS:
+{fields}
+
+RULES:
+1. Use ONLY information explicitly stated in the text
+2. Use null for any field the text doesn't give
+3. Amounts are numbers in INR (remove ₹, Rs., commas); percentages are numbers only
+
+TEXT:
+{text}
+
+Respond with ONLY valid JSON containing just these fields, nested as their names show (e.g. {{"fees": {{"annualFee": 500}}}})."""
+
+# SchemaValidator field paths that are named differently in the extraction
+CARD_FIELD_PATHS = {
+    "basicInfo.name": ("name",),
+    "basicInfo.network": ("network",),
+    "charges.interestRate.annual": ("charges", "interestRateAnnual"),
+}
+
+
+@dataclass
+class ProcessorConfig:
+    """Configuration for LLM extraction."""
+    
+    # Cards sent to Ollama at once (match the servers' OLLAMA_NUM_PARALLEL)
+    max_in_flight: int = 2
+    
+    # Ollama servers to spread requests over, e.g. ["http://gpu1:11434"];
+    # None uses the default client (OLLAMA_HOST or localhost)
+    hosts: Optional[list[str]] = None
+    
+    # Response cache (SQLite), keyed by model, prompt and options; None disables it
+    cache_path: Optional[str] = None
+    cache_max_entries: Optional[int] = 10000
+    cache_max_age_days: Optional[float] = 30
+    cache_bypass: bool = False  # Always ask the model (fresh answers are still cached)
+    
+    # Constrain replies to the ExtractedCard JSON schema (Ollama `format`)
+    structured_output: bool = True
+    
+    # How page text is fitted into prompts:
+    # "chunked" splits long pages into chunks of about chunk_tokens tokens,
+    # extracts them in parallel and merges the results;
+    # "ranked" sends the most data-dense sections within context_tokens;
+    # "sections" asks for each schema slice (fees, rewards, ...) in parallel,
+    # from the page sections about it, within context_tokens each;
+    # "truncate" sends only the first max_chars characters
+    extraction_mode: str = "chunked"
+    chunk_tokens: int = 2000
+    context_tokens: int = 1500
+    max_chars: int = 8000
+    
+    # Fill fixed-pattern fields (fees, markup, interest, late fee, lounge
+    # visits, network) with regex rules and ask the LLM only for the rest;
+    # only a card with every extraction field resolved skips the LLM
+    rules: bool = True
+    rules_min_confidence: float = 0.8
+    
+    # Models to try in order, e.g. ["llama3.2:1b", "llama3.1:8b"]: a card
+    # moves to the next model only when the reply has no JSON, required
+    # fields are missing or SchemaValidator reports errors. None uses the
+    # processor's single model.
+    cascade: Optional[list[str]] = None
+    
+    # Stream replies and stop generation once the JSON object is complete,
+    # or as soon as the output can't become one
+    stream: bool = False
+    
+    # Ask again, in a short prompt with only the relevant snippets, for
+    # required fields that are missing and fields SchemaValidator flags
+    reask: bool = False
+    reask_tokens: int = 600
+
 
 class OllamaProcessor:
     """
@@ -117,13 +218,22 @@ class OllamaProcessor:
     
     DEFAULT_MODEL = "llama3.2"  # Good balance of speed and quality
     FALLBACK_MODELS = ["llama3.1", "mistral", "mixtral"]
+    EXTRACTION_MODES = ("chunked", "ranked", "sections", "truncate")
     
-    def __init__(self, model: Optional[str] = None):
+    def __init__(
+        self,
+        model: Optional[str] = None,
+        boilerplate: Optional[BoilerplateFilter] = None,
+        config: Optional[ProcessorConfig] = None,
+    ):
         """
         Initialize the Ollama processor.
         
         Args:
             model: Ollama model name to use (default: llama3.2)
+            boilerplate: Fitted filter that strips template text shared by
+                an issuer's pages before extraction
+            config: Concurrency and server settings (defaults to ProcessorConfig())
         """
         if ollama is None:
             raise ImportError(
@@ -131,21 +241,77 @@ class OllamaProcessor:
                 "Install with: pip install ollama"
             )
         
+        self.boilerplate = boilerplate
+        self.config = config or ProcessorConfig()
         self.model = model or self.DEFAULT_MODEL
+        if self.config.cascade:
+            self.model = self.config.cascade[0]
+        if self.config.extraction_mode not in self.EXTRACTION_MODES:
+            raise ValueError(
+                f"Unknown extraction mode '{self.config.extraction_mode}'. "
+                f"Available: {', '.join(self.EXTRACTION_MODES)}"
+            )
+        
+        # The ollama module itself serves as the default client
+        self._clients: list[Any] = (
+            [ollama.Client(host=host) for host in self.config.hosts]
+            if self.config.hosts else [ollama]
+        )
+        self._next_client = itertools.cycle(self._clients)
+        self._client_lock = threading.Lock()
+        # Caps Ollama requests across cards and the chunks of each card
+        self._in_flight = threading.BoundedSemaphore(max(1, self.config.max_in_flight))
+        self.response_format = (
+            extraction_json_schema() if self.config.structured_output else None
+        )
+        self.rules = (
+            RuleExtractor(self.config.rules_min_confidence) if self.config.rules else None
+        )
+        self.rule_fields = 0
+        # Cards finished and escalated, per cascade model
+        self.stage_finished: Counter = Counter()
+        self.stage_escalated: Counter = Counter()
+        self.streams_stopped = 0
+        self.repaired_replies = 0
+        self.reasks = 0
+        self.reask_patched = 0
+        self._extraction_fields = schema_fields(extraction_json_schema())
+        self._validator = SchemaValidator()
+        self._stats_lock = threading.Lock()
+        self.cache = None
+        if self.config.cache_path:
+            self.cache = LLMCache(
+                self.config.cache_path,
+                max_entries=self.config.cache_max_entries,
+                max_age_days=self.config.cache_max_age_days,
+            )
         self._verify_model()
+        self.models = self._verify_cascade() if self.config.cascade else [self.model]
+    
+    def _verify_cascade(self) -> list[str]:
+        """Cascade models that are available; missing ones are skipped."""
+        models = [self.model]
+        for model in self.config.cascade[1:]:
+            try:
+                self._clients[0].show(model)
+                models.append(model)
+            except Exception:
+                print(f"Cascade model {model} not found, skipping it")
+        print(f"Model cascade: {' -> '.join(models)}")
+        return models
     
     def _verify_model(self):
         """Verify the model is available, try fallbacks if not."""
         try:
             # Check if model exists
-            ollama.show(self.model)
+            self._clients[0].show(self.model)
             print(f"Using Ollama model: {self.model}")
         except Exception:
             print(f"Model {self.model} not found, trying fallbacks...")
             
             for fallback in self.FALLBACK_MODELS:
                 try:
-                    ollama.show(fallback)
+                    self._clients[0].show(fallback)
                     self.model = fallback
                     print(f"Using fallback model: {self.model}")
                     return
@@ -155,41 +321,144 @@ class OllamaProcessor:
             print(f"No models found. Please pull a model with: ollama pull {self.DEFAULT_MODEL}")
     
     def _extract_json_from_response(self, response: str) -> Optional[dict]:
-        """Extract JSON from LLM response, handling various formats."""
+        """
+        Extract JSON from LLM response, handling various formats.
+        
+        Objects are found in one string-aware pass, which skips
+        explanations and markdown fences around them. The longest object
+        that parses wins; failing that, the first one that can be repaired
+        (trailing commas, output cut off at num_predict).
+        """
         # Try direct JSON parse first
         try:
-            return json.loads(response)
+            data = json.loads(response)
+            if isinstance(data, dict):
+                return data
         except json.JSONDecodeError:
             pass
         
-        # Try to find JSON in markdown code blocks
-        json_patterns = [
-            r"```json\s*([\s\S]*?)\s*```",
-            r"```\s*([\s\S]*?)\s*```",
-            r"\{[\s\S]*\}",
-        ]
+        candidates = list(iter_json_candidates(response))
+        parsed = []
+        for candidate, complete in candidates:
+            if not complete:
+                continue
+            try:
+                parsed.append((len(candidate), json.loads(candidate)))
+            except json.JSONDecodeError:
+                continue
+        if parsed:
+            return max(parsed, key=lambda item: item[0])[1]
         
-        for pattern in json_patterns:
-            matches = re.findall(pattern, response)
-            for match in matches:
-                try:
-                    return json.loads(match)
-                except json.JSONDecodeError:
-                    continue
+        for candidate, _ in candidates:
+            repaired = repair_json(candidate)
+            if repaired and isinstance(repaired, dict):
+                with self._stats_lock:
+                    self.repaired_replies += 1
+                return repaired
         
         return None
     
-    def _call_ollama(self, prompt: str) -> str:
-        """Make a call to Ollama API."""
-        response = ollama.chat(
-            model=self.model,
+    def _client(self) -> Any:
+        """Pick the next Ollama server, round-robin."""
+        with self._client_lock:
+            return next(self._next_client)
+    
+    def _call_ollama(
+        self,
+        prompt: str,
+        format: Optional[dict] = None,
+        model: Optional[str] = None,
+    ) -> str:
+        """
+        Make a call to Ollama API, through the response cache if configured.
+        
+        Only complete replies are cached: ones cut off by num_predict or
+        streams stopped on output that can't become JSON are returned but
+        not stored, so later runs ask again.
+        
+        Args:
+            prompt: User message
+            format: JSON schema the reply must follow (None for free text)
+            model: Model to ask (default: self.model)
+        """
+        model = model or self.model
+        options = {
+            "temperature": 0.1,  # Low temperature for consistent extraction
+            "num_predict": 2048,
+        }
+        
+        key = None
+        if self.cache is not None:
+            key = LLMCache.key(model, prompt, options, format)
+            if not self.config.cache_bypass:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return cached
+        
+        request = {}
+        if format is not None:
+            request["format"] = format
+        with self._in_flight:
+            if self.config.stream:
+                content, complete = self._stream_chat(model, prompt, options, request)
+            else:
+                response = self._client().chat(
+                    model=model,
+                    messages=[{"role": "user", "content": prompt}],
+                    options=options,
+                    **request,
+                )
+                content = response["message"]["content"]
+                complete = self._finished(response)
+        
+        if key is not None and complete:
+            self.cache.put(key, model, content)
+        return content
+    
+    @staticmethod
+    def _finished(response: Any) -> bool:
+        """Whether Ollama ended a reply itself, rather than at num_predict."""
+        return response.get("done_reason") in (None, "stop")
+    
+    def _stream_chat(
+        self, model: str, prompt: str, options: dict, request: dict
+    ) -> tuple[str, bool]:
+        """
+        Stream a reply, stopping once the top-level JSON object closes.
+        
+        Closing the stream disconnects from Ollama, which ends generation.
+        
+        Returns:
+            (the JSON object alone if it completed, otherwise all output;
+            whether the reply is complete: the object closed, or the model
+            finished on its own without the output going wrong)
+        """
+        scanner = JsonScanner()
+        stream = self._client().chat(
+            model=model,
             messages=[{"role": "user", "content": prompt}],
-            options={
-                "temperature": 0.1,  # Low temperature for consistent extraction
-                "num_predict": 2048,
-            }
+            options=options,
+            stream=True,
+            **request,
         )
-        return response["message"]["content"]
+        finished = False
+        try:
+            for part in stream:
+                scanner.feed(part["message"]["content"])
+                if part.get("done"):
+                    finished = self._finished(part)
+                    break
+                if scanner.done:
+                    with self._stats_lock:
+                        self.streams_stopped += 1
+                    break
+        finally:
+            close = getattr(stream, "close", None)
+            if close:
+                close()
+        if scanner.object_text is not None:
+            return scanner.object_text, True
+        return scanner.text, finished and scanner.state != FAILED
     
     def process_raw_data(self, raw_data: RawCardData) -> Optional[CreditCard]:
         """
@@ -201,32 +470,421 @@ class OllamaProcessor:
         Returns:
             CreditCard object or None if extraction failed
         """
-        # Truncate text if too long (LLM context limits)
-        text = raw_data.text_content[:8000]
+        text = raw_data.text_content
+        if self.boilerplate is not None:
+            text = self.boilerplate.clean(raw_data.issuer, text)
         
-        prompt = EXTRACTION_PROMPT.format(
-            schema=EXTRACTION_SCHEMA,
-            text=text,
-            card_name=raw_data.page_title,
-            issuer=raw_data.issuer
-        )
+        resolved = self.rules.extract(text) if self.rules is not None else {}
         
         try:
-            response = self._call_ollama(prompt)
-            extracted = self._extract_json_from_response(response)
+            with self._stats_lock:
+                self.rule_fields += len(resolved)
             
-            if not extracted:
-                print(f"Failed to extract JSON for {raw_data.page_title}")
-                return None
-            
-            # Convert extracted data to CreditCard model
-            card = self._build_credit_card(extracted, raw_data)
-            return card
+            for stage, model in enumerate(self.models):
+                last = stage == len(self.models) - 1
+                parts = self._extract_page(text, raw_data, list(resolved), model)
+                card, problem = None, "no JSON in reply"
+                if parts:
+                    extracted = apply_matches(merge_extractions(parts), resolved)
+                    # Convert extracted data to CreditCard model
+                    card = self._build_credit_card(extracted, raw_data)
+                    if self.config.reask:
+                        extracted, card = self._reask_failing(
+                            text, raw_data, extracted, card, list(resolved), model
+                        )
+                    problem = self._escalation_reason(extracted, card)
+                
+                if problem and not last:
+                    with self._stats_lock:
+                        self.stage_escalated[model] += 1
+                    print(f"  {raw_data.page_title}: {problem} from {model}, escalating")
+                    continue
+                if not card:
+                    print(f"Failed to extract JSON for {raw_data.page_title}")
+                    return None
+                with self._stats_lock:
+                    self.stage_finished[model] += 1
+                return card
             
         except Exception as e:
             print(f"Error processing {raw_data.page_title}: {e}")
             return None
     
+    def _escalation_reason(self, extracted: dict, card: CreditCard) -> Optional[str]:
+        """Why a cascade stage's result isn't good enough, or None if it is."""
+        if len(self.models) == 1:
+            return None
+        missing = [
+            ".".join(path) for path in REQUIRED_FIELDS
+            if self._field_value(extracted, path) in (None, [], "")
+        ]
+        if missing:
+            return f"missing {', '.join(missing)}"
+        errors = self._validator.validate_card(card).errors
+        if errors:
+            return f"invalid ({errors[0]})"
+        return None
+    
+    @staticmethod
+    def _field_value(data: dict, path: tuple[str, ...]) -> Any:
+        for key in path:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(key)
+        return data
+    
+    @staticmethod
+    def _set_field(data: dict, path: tuple[str, ...], value: Any):
+        for key in path[:-1]:
+            if not isinstance(data.get(key), dict):
+                data[key] = {}
+            data = data[key]
+        data[path[-1]] = value
+    
+    def _failing_fields(
+        self,
+        extracted: dict,
+        card: CreditCard,
+        resolved: list[tuple],
+    ) -> tuple[list[tuple], set[tuple]]:
+        """
+        Extraction fields worth asking about again.
+        
+        Returns:
+            (missing required fields and flagged fields, the flagged ones)
+        """
+        failing = [
+            path for path in REQUIRED_FIELDS
+            if self._field_value(extracted, path) in (None, [], "")
+        ]
+        result = self._validator.validate_card(card)
+        invalid = set()
+        for name in result.error_fields + result.warning_fields:
+            path = CARD_FIELD_PATHS.get(name, tuple(name.split(".")))
+            if path not in self._extraction_fields:
+                continue
+            invalid.add(path)
+            if path not in failing:
+                failing.append(path)
+        # Rule values are trusted
+        failing = [path for path in failing if path not in resolved]
+        return failing, invalid - set(resolved)
+    
+    def _reask_failing(
+        self,
+        text: str,
+        raw_data: RawCardData,
+        extracted: dict,
+        card: CreditCard,
+        resolved: list[tuple],
+        model: Optional[str] = None,
+    ) -> tuple[dict, CreditCard]:
+        """
+        Ask only for missing or flagged fields and patch the answers in.
+        
+        The prompt holds just the page snippets that mention those fields.
+        A flagged value is dropped (so the card builder's default applies)
+        when the reply parsed and left that field empty, and an answer is
+        dropped if it still fails validation; with no snippets to ask
+        about, or no usable reply, the original stays.
+        
+        Returns:
+            (patched extraction, card rebuilt from it)
+        """
+        failing, invalid = self._failing_fields(extracted, card, resolved)
+        if not failing:
+            return extracted, card
+        
+        keywords: list[str] = []
+        for path in failing:
+            keywords.extend(word for word in field_keywords(path) if word not in keywords)
+        snippets = select_for_keywords(text, keywords, self.config.reask_tokens)
+        
+        # Stays None unless the model was asked and its reply parsed
+        answer: Optional[dict] = None
+        if snippets:
+            lines = []
+            for path in failing:
+                spec = self._extraction_fields[path]
+                description = spec.get("description") or spec.get("title", "")
+                if path in invalid:
+                    current = json.dumps(self._field_value(extracted, path), ensure_ascii=False)
+                    status = f"extracted {current}, which looks wrong"
+                else:
+                    status = "not found"
+                lines.append(f"- {'.'.join(path)}: {description} ({status})")
+            prompt = REASK_PROMPT.format(
+                card_name=raw_data.page_title,
+                issuer=raw_data.issuer,
+                fields="\n".join(lines),
+                text=snippets,
+            )
+            excluded = [path for path in self._extraction_fields if path not in failing]
+            response_format = (
+                prune_schema(extraction_json_schema(), excluded)
+                if self.config.structured_output else None
+            )
+            with self._stats_lock:
+                self.reasks += 1
+            reply = self._extract_json_from_response(
+                self._call_ollama(prompt, format=response_format, model=model)
+            )
+            if reply:
+                answer = self._normalize_extraction(reply)
+        
+        if answer is None:
+            return extracted, card
+        
+        patched = copy.deepcopy(extracted)
+        answered, dropped = [], []
+        for path in failing:
+            value = self._field_value(answer, path)
+            if value not in (None, [], ""):
+                self._set_field(patched, path, value)
+                answered.append(path)
+            elif path in invalid:
+                # The model saw the relevant text and didn't confirm the value
+                if self._drop_field(patched, path):
+                    dropped.append(path)
+        if not answered and not dropped:
+            return extracted, card
+        
+        card = self._build_credit_card(patched, raw_data)
+        if answered:
+            # An answer only counts if it passes validation; a repeated or
+            # new wrong value is dropped like an unconfirmed one
+            _, still_invalid = self._failing_fields(patched, card, resolved)
+            rejected = [path for path in answered if path in still_invalid]
+            for path in rejected:
+                self._drop_field(patched, path)
+            if rejected:
+                card = self._build_credit_card(patched, raw_data)
+            with self._stats_lock:
+                self.reask_patched += len(answered) - len(rejected)
+        return patched, card
+    
+    @staticmethod
+    def _drop_field(data: dict, path: tuple[str, ...]) -> bool:
+        """Remove a field so the card builder's default applies."""
+        parent = OllamaProcessor._field_value(data, path[:-1]) if len(path) > 1 else data
+        if isinstance(parent, dict) and path[-1] in parent:
+            del parent[path[-1]]
+            return True
+        return False
+    
+    def _extract_page(
+        self,
+        text: str,
+        raw_data: RawCardData,
+        resolved: list[tuple],
+        model: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Ask the model for a page's unresolved fields, as the extraction mode says.
+        
+        Returns:
+            Normalized partial extractions, to be merged
+        """
+        if self.config.extraction_mode == "sections":
+            tasks = plan_section_tasks(text, self.config.context_tokens)
+            if tasks:
+                return self._extract_sections(tasks, raw_data, resolved, model)
+        
+        if self.config.extraction_mode == "truncate":
+            # Truncate text if too long (LLM context limits)
+            chunks = [text[:self.config.max_chars]]
+        elif self.config.extraction_mode == "ranked":
+            chunks = [select_context(text, self.config.context_tokens)]
+        else:
+            # Chunked, and sections mode for pages without sections
+            chunks = chunk_text(text, self.config.chunk_tokens)
+        
+        schema, response_format = self._schemas_for(resolved)
+        return self._extract_chunks(chunks, raw_data, schema, response_format, model)
+    
+    def _schemas_for(self, excluded: list[tuple]) -> tuple[str, Optional[dict]]:
+        """
+        Prompt schema and response format without the excluded fields.
+        
+        Args:
+            excluded: Field paths not to ask for, e.g. ("fees", "annualFee")
+                or ("rewards",)
+        
+        Returns:
+            (schema text for the prompt, JSON schema for Ollama's `format`)
+        """
+        if not excluded:
+            return EXTRACTION_SCHEMA, self.response_format
+        pruned = prune_schema(extraction_json_schema(), excluded)
+        return (
+            prune_schema_text(EXTRACTION_SCHEMA, excluded),
+            pruned if self.config.structured_output else None,
+        )
+    
+    def _extract_sections(
+        self,
+        tasks: list[SectionTask],
+        raw_data: RawCardData,
+        resolved: list[tuple],
+        model: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Extract each schema slice from its sections, in parallel.
+        
+        Slices the rules fully resolved are not asked for.
+        
+        Returns:
+            Normalized extractions of the slices that parsed
+        """
+        jobs = []
+        for task in tasks:
+            excluded = [
+                (field,) for field in ExtractedCard.model_fields
+                if field not in task.fields
+            ]
+            excluded.extend(path for path in resolved if path[0] in task.fields)
+            if not prune_schema(extraction_json_schema(), excluded).get("properties"):
+                continue
+            schema, response_format = self._schemas_for(excluded)
+            jobs.append((task, schema, response_format))
+        if not jobs:
+            return []
+        
+        def extract(job) -> Optional[dict]:
+            task, schema, response_format = job
+            extracted = self._extract_chunk(task.text, raw_data, schema, response_format, model)
+            if not extracted:
+                return None
+            # Only trust a reply for the fields its sections are about
+            return {field: value for field, value in extracted.items() if field in task.fields}
+        
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            results = list(executor.map(extract, jobs))
+        
+        failed = sum(1 for result in results if not result)
+        if failed:
+            print(f"  {failed}/{len(jobs)} sections of {raw_data.page_title} failed to extract")
+        return [result for result in results if result]
+    
+    def _extract_chunks(
+        self,
+        chunks: list[str],
+        raw_data: RawCardData,
+        schema: str = EXTRACTION_SCHEMA,
+        response_format: Optional[dict] = None,
+        model: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Extract every chunk of a page, in parallel.
+        
+        Args:
+            chunks: Page text, split to fit the prompt
+            raw_data: The page the chunks came from
+            schema: Schema shown in the prompt
+            response_format: JSON schema the replies must follow
+            model: Model to ask (default: self.model)
+        
+        Returns:
+            Normalized extractions of the chunks that parsed, in page order
+        """
+        if len(chunks) == 1:
+            extracted = self._extract_chunk(chunks[0], raw_data, schema, response_format, model)
+            return [extracted] if extracted else []
+        
+        texts = [
+            f"[Part {i} of {len(chunks)} of the page]\n{chunk}"
+            for i, chunk in enumerate(chunks, 1)
+        ]
+        with ThreadPoolExecutor(max_workers=len(texts)) as executor:
+            results = list(executor.map(
+                lambda text: self._extract_chunk(text, raw_data, schema, response_format, model),
+                texts,
+            ))
+        
+        failed = sum(1 for result in results if not result)
+        if failed:
+            print(f"  {failed}/{len(chunks)} chunks of {raw_data.page_title} failed to extract")
+        return [result for result in results if result]
+    
+    def _extract_chunk(
+        self,
+        text: str,
+        raw_data: RawCardData,
+        schema: str = EXTRACTION_SCHEMA,
+        response_format: Optional[dict] = None,
+        model: Optional[str] = None,
+    ) -> Optional[dict]:
+        """Ask the model for one chunk's fields; None if the reply has no JSON."""
+        prompt = EXTRACTION_PROMPT.format(
+            schema=schema,
+            text=text,
+            card_name=raw_data.page_title,
+            issuer=raw_data.issuer
+        )
+        response = self._call_ollama(prompt, format=response_format, model=model)
+        extracted = self._extract_json_from_response(response)
+        if not extracted:
+            return None
+        return self._normalize_extraction(extracted)
+    
+    MAX_FIELD_REPAIRS = 10
+    
+    def _normalize_extraction(self, data: dict) -> dict:
+        """
+        Coerce extracted JSON into the ExtractedCard shape.
+        
+        Fields the schema rejects (e.g. "N/A" for a fee, or an accelerated
+        category without a name) are dropped one at a time until the rest
+        validates. Nulls are dropped so _build_credit_card falls back to
+        its defaults. Replies that still don't fit are used as they are.
+        """
+        data = copy.deepcopy(data)
+        for _ in range(self.MAX_FIELD_REPAIRS):
+            try:
+                card = ExtractedCard.model_validate(data)
+            except ValidationError as e:
+                if not self._drop_invalid_field(data, e.errors()[0]):
+                    break
+                continue
+            return card.model_dump(mode="json", exclude_none=True)
+        return self._drop_nulls(data)
+    
+    @staticmethod
+    def _drop_invalid_field(data: dict, error: dict) -> bool:
+        """
+        Remove the value a validation error points at.
+        
+        A missing required field drops the object it belongs to.
+        
+        Returns:
+            False if there was nothing to remove
+        """
+        path = list(error["loc"])
+        if error["type"] == "missing":
+            path = path[:-1]
+        if not path:
+            return False
+        
+        target: Any = data
+        for key in path[:-1]:
+            try:
+                target = target[key]
+            except (KeyError, IndexError, TypeError):
+                return False
+        try:
+            del target[path[-1]]
+        except (KeyError, IndexError, TypeError):
+            return False
+        return True
+    
+    def _drop_nulls(self, value):
+        """Recursively remove null values from dicts."""
+        if isinstance(value, dict):
+            return {k: self._drop_nulls(v) for k, v in value.items() if v is not None}
+        if isinstance(value, list):
+            return [self._drop_nulls(v) for v in value]
+        return value
+    
     def _build_credit_card(self, data: dict, raw_data: RawCardData) -> CreditCard:
         """Build a CreditCard object from extracted data."""
         
@@ -444,21 +1102,38 @@ class OllamaProcessor:
         """
         Process a batch of raw data.
         
+        Up to config.max_in_flight cards are extracted at once; a card
+        that fails doesn't affect the others.
+        
         Args:
             raw_data_list: List of RawCardData objects
             
         Returns:
-            List of successfully processed CreditCard objects
+            List of successfully processed CreditCard objects, in input order
         """
-        cards = []
-        for i, raw_data in enumerate(raw_data_list, 1):
-            print(f"Processing {i}/{len(raw_data_list)}: {raw_data.page_title}")
-            
-            card = self.process_raw_data(raw_data)
-            if card:
-                cards.append(card)
-                print(f"  ✓ Extracted: {card.basicInfo.name}")
-            else:
-                print(f"  ✗ Failed to extract")
+        total = len(raw_data_list)
+        results: list[Optional[CreditCard]] = [None] * total
+        
+        def process(raw_data: RawCardData) -> Optional[CreditCard]:
+            try:
+                return self.process_raw_data(raw_data)
+            except Exception as e:
+                print(f"Error processing {raw_data.page_title}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max(1, self.config.max_in_flight)) as executor:
+            futures = {
+                executor.submit(process, raw_data): i
+                for i, raw_data in enumerate(raw_data_list)
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                card = future.result()
+                results[i] = card
+                title = raw_data_list[i].page_title
+                if card:
+                    print(f"[{done}/{total}] ✓ Extracted: {card.basicInfo.name} ({title})")
+                else:
+                    print(f"[{done}/{total}] ✗ Failed to extract: {title}")
         
-        return cards
+        return [card for card in results if card]
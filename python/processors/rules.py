@@ -0,0 +1,357 @@
+"""
+Rule-based extraction of fields that follow fixed patterns on bank pages.
+Fees, forex markup, interest per month, late fee, lounge visits and the
+card network are usually written the same way on every page, so compiled
+regexes can fill them with a confidence score. The LLM is only asked for
+what the rules leave unresolved.
+"""
+
+import copy
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+
+# An amount in INR, or a word meaning no fee
+AMOUNT = r"(?:(?:₹|rs\.?|inr)\s*(?P<amount>\d[\d,]*(?:\.\d+)?)|(?P<nil>\bnil\b|\bfree\b|\bzero\b))"
+PERCENT = r"(?P<percent>\d+(?:\.\d+)?)\s*%"
+
+# Up to this many characters may separate a label from its value. The gap
+# can't cross a waiver or spend condition ("Annual fee waived on spends of
+# ₹3,00,000"), whose amount is a threshold, not the fee.
+GAP = r"(?:(?!waiv|spend|milestone)[^₹\n]){0,40}?"
+
+# Fields every card should have; missing ones trigger cascade escalation
+# and re-asks
+REQUIRED_FIELDS = (
+    ("network",),
+    ("fees", "joiningFee"),
+    ("fees", "annualFee"),
+    ("charges", "interestRateAnnual"),
+    ("charges", "foreignTxnFee"),
+    ("charges", "lateFee"),
+)
+
+NETWORKS = {
+    "visa": "Visa",
+    "mastercard": "Mastercard",
+    "rupay": "RuPay",
+    "american express": "Amex",
+    "amex": "Amex",
+    "diners club": "Diners",
+}
+NETWORK_PATTERN = re.compile(
+    r"\b(" + "|".join(re.escape(name) for name in NETWORKS) + r")\b",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class RuleMatch:
+    """A field value found by a rule."""
+
+    path: tuple[str, ...]
+    value: Any
+    confidence: float
+    evidence: str
+
+
+def _amount(match: re.Match) -> Optional[float]:
+    if match.group("nil"):
+        return 0.0
+    return float(match.group("amount").replace(",", ""))
+
+
+@dataclass
+class Rule:
+    """A pattern for one field, with how to read its value and how far to trust it."""
+
+    path: tuple[str, ...]
+    pattern: re.Pattern
+    value: Callable[[re.Match], Any]
+    confidence: float
+
+
+def _rule(path: tuple[str, ...], pattern: str, value: Callable[[re.Match], Any], confidence: float) -> Rule:
+    return Rule(path, re.compile(pattern, re.IGNORECASE), value, confidence)
+
+
+RULES = [
+    _rule(
+        ("fees", "joiningFee"),
+        r"\b(?:joining|one[- ]time membership) fee" + GAP + AMOUNT,
+        _amount, 0.9,
+    ),
+    _rule(
+        ("fees", "annualFee"),
+        r"\b(?:annual|renewal|annual membership) fee" + GAP + AMOUNT,
+        _amount, 0.9,
+    ),
+    _rule(
+        ("charges", "foreignTxnFee"),
+        r"\b(?:foreign currency|forex|cross[- ]currency) (?:transaction )?mark[- ]?up" + GAP + PERCENT,
+        lambda match: float(match.group("percent")), 0.9,
+    ),
+    _rule(
+        ("charges", "foreignTxnFee"),
+        PERCENT + r"\s*(?:of\s+)?(?:foreign currency|forex|cross[- ]currency) (?:transaction )?mark[- ]?up",
+        lambda match: float(match.group("percent")), 0.9,
+    ),
+    _rule(
+        ("charges", "interestRateAnnual"),
+        r"\b(?:interest|finance charges?)" + GAP + PERCENT + r"\s*(?:per month|p\.?\s?m\.?|monthly)",
+        lambda match: round(float(match.group("percent")) * 12, 2), 0.9,
+    ),
+    _rule(
+        ("charges", "interestRateAnnual"),
+        r"\b(?:interest|finance charges?)" + GAP + PERCENT + r"\s*(?:per annum|p\.?\s?a\.?|annually)",
+        lambda match: float(match.group("percent")), 0.85,
+    ),
+    _rule(
+        ("charges", "lateFee"),
+        r"\blate (?:payment )?(?:fee|charges?)" + GAP + AMOUNT,
+        _amount, 0.85,
+    ),
+    _rule(
+        ("loungeAccess", "domestic", "freeVisits"),
+        r"\b(?P<visits>\d+)\s+(?:complimentary\s+|free\s+)?domestic\s+(?:airport\s+)?lounge\s+(?:access(?:es)?|visits?)",
+        lambda match: int(match.group("visits")), 0.85,
+    ),
+    _rule(
+        ("loungeAccess", "international", "freeVisits"),
+        r"\b(?P<visits>\d+)\s+(?:complimentary\s+|free\s+)?international\s+(?:airport\s+)?lounge\s+(?:access(?:es)?|visits?)",
+        lambda match: int(match.group("visits")), 0.85,
+    ),
+]
+
+# Lines like "Late fee: ₹100 to ₹1,300" are slabs, not a single fee
+SLAB = re.compile(
+    r"(?:₹|rs\.?|inr)\s*\d[\d,]*\s*(?:to|-|–)\s*(?:₹|rs\.?|inr)?\s*\d",
+    re.IGNORECASE,
+)
+INR_AMOUNT = re.compile(r"(?:₹|rs\.?|inr)\s*\d", re.IGNORECASE)
+SLAB_PENALTY = 0.6
+# Different values for one field on the same page
+CONFLICT_PENALTY = 0.7
+
+
+class RuleExtractor:
+    """
+    Fills easy fields from page text with compiled patterns.
+
+    Each field keeps its most common value. Confidence drops when the page
+    gives conflicting values or the value is one of several amounts on its
+    line; fields below `min_confidence` are left to the LLM.
+    """
+
+    def __init__(self, min_confidence: float = 0.8):
+        self.min_confidence = min_confidence
+
+    def extract(self, text: str) -> dict[tuple[str, ...], RuleMatch]:
+        """
+        Run every rule over the text.
+
+        Returns:
+            Confident matches, keyed by field path
+        """
+        candidates: dict[tuple[str, ...], list[RuleMatch]] = {}
+        for rule in RULES:
+            for match in rule.pattern.finditer(text):
+                try:
+                    value = rule.value(match)
+                except (TypeError, ValueError):
+                    continue
+                confidence = rule.confidence
+                line = self._line(text, match)
+                if (
+                    SLAB.search(line)
+                    or len(INR_AMOUNT.findall(line)) > 2
+                    or self._conditional_nil(text, match)
+                ):
+                    confidence *= SLAB_PENALTY
+                candidates.setdefault(rule.path, []).append(
+                    RuleMatch(rule.path, value, confidence, match.group(0))
+                )
+
+        network = self._network(text)
+        if network:
+            candidates[network.path] = [network]
+
+        resolved = {}
+        for path, matches in candidates.items():
+            best = self._best(matches)
+            if best.confidence >= self.min_confidence:
+                resolved[path] = best
+        return resolved
+
+    @staticmethod
+    def _conditional_nil(text: str, match: re.Match) -> bool:
+        """
+        Whether "free"/"nil" is followed by an amount on the same line
+        ("Free for the first year, ₹499 thereafter"), so it isn't the fee.
+        """
+        if not match.groupdict().get("nil"):
+            return False
+        end = text.find("\n", match.end())
+        return bool(INR_AMOUNT.search(text, match.end(), end if end != -1 else len(text)))
+
+    @staticmethod
+    def _line(text: str, match: re.Match) -> str:
+        start = text.rfind("\n", 0, match.start()) + 1
+        end = text.find("\n", match.end())
+        return text[start:end if end != -1 else len(text)]
+
+    @staticmethod
+    def _best(matches: list[RuleMatch]) -> RuleMatch:
+        """Most supported value; penalized if the page disagrees with itself."""
+        support: dict[str, float] = {}
+        for match in matches:
+            key = json.dumps(match.value)
+            support[key] = support.get(key, 0) + match.confidence
+        best_key = max(support, key=support.get)
+        best = max(
+            (match for match in matches if json.dumps(match.value) == best_key),
+            key=lambda match: match.confidence,
+        )
+        if len(support) > 1:
+            best = RuleMatch(best.path, best.value, best.confidence * CONFLICT_PENALTY, best.evidence)
+        return best
+
+    @staticmethod
+    def _network(text: str) -> Optional[RuleMatch]:
+        """The card network, when the page names exactly one."""
+        found = {NETWORKS[name.lower()] for name in NETWORK_PATTERN.findall(text)}
+        if not found:
+            return None
+        confidence = 0.85 if len(found) == 1 else 0.5
+        return RuleMatch(("network",), sorted(found), confidence, ", ".join(sorted(found)))
+
+
+def apply_matches(extracted: dict, resolved: dict[tuple[str, ...], RuleMatch]) -> dict:
+    """Write rule values into an extraction; they take precedence over the LLM's."""
+    result = copy.deepcopy(extracted)
+    for path, match in resolved.items():
+        target = result
+        for key in path[:-1]:
+            if not isinstance(target.get(key), dict):
+                target[key] = {}
+            target = target[key]
+        target[path[-1]] = match.value
+    return result
+
+
+def prune_schema(schema: dict, resolved: list[tuple[str, ...]]) -> dict:
+    """
+    Remove resolved fields from an extraction JSON schema.
+
+    Objects left without properties are removed too, so the model is only
+    asked for what is still missing.
+    """
+    schema = copy.deepcopy(schema)
+    for path in resolved:
+        _remove_path(schema, path)
+    return schema
+
+
+def schema_fields(schema: dict, prefix: tuple[str, ...] = ()) -> dict[tuple[str, ...], dict]:
+    """Leaf fields of a JSON schema (values and lists), keyed by path."""
+    objects = _object_schemas(schema)
+    if not objects:
+        return {prefix: schema}
+    fields = {}
+    for name, prop in objects[0]["properties"].items():
+        fields.update(schema_fields(prop, prefix + (name,)))
+    return fields
+
+
+def _object_schemas(schema: dict) -> list[dict]:
+    """The object schemas a property may hold (through Optional's anyOf)."""
+    if "properties" in schema:
+        return [schema]
+    return [option for option in schema.get("anyOf", []) if "properties" in option]
+
+
+def _remove_path(schema: dict, path: tuple[str, ...]) -> bool:
+    """Remove a field; returns whether the schema has no properties left."""
+    for obj in _object_schemas(schema):
+        properties = obj["properties"]
+        if path[0] not in properties:
+            continue
+        if len(path) == 1 or _remove_path(properties[path[0]], path[1:]):
+            del properties[path[0]]
+            if path[0] in obj.get("required", []):
+                obj["required"].remove(path[0])
+        if not properties:
+            return True
+    return False
+
+
+def prune_schema_text(schema_text: str, resolved: list[tuple[str, ...]]) -> str:
+    """
+    Remove resolved fields from the prompt's schema outline (one field per line).
+
+    A resolved object path removes the whole object. Fields written inline
+    with their siblings (the lounge tiers) stay until their whole line is
+    resolved.
+    """
+    resolved = set(resolved)
+
+    def is_resolved(path: tuple[str, ...]) -> bool:
+        return any(path[:i] in resolved for i in range(1, len(path) + 1))
+
+    kept: list[str] = []
+    parents: list[str] = []
+    # Open brackets of a removed field that spans several lines
+    skipping = 0
+    for line in schema_text.splitlines():
+        stripped = line.strip()
+        if skipping:
+            skipping += stripped.count("[") - stripped.count("]")
+            continue
+        field = re.match(r'"(\w+)":', stripped)
+        if stripped.startswith("}"):
+            parents = parents[:-1]
+            if kept and kept[-1].rstrip().endswith("{"):
+                # Every field of this object was resolved
+                kept.pop()
+            else:
+                if kept:
+                    kept[-1] = kept[-1].rstrip().rstrip(",")
+                kept.append(line)
+            continue
+        if field and stripped.endswith("{"):
+            parents.append(field.group(1))
+            kept.append(line)
+            continue
+        if field and is_resolved(tuple(parents + [field.group(1)])):
+            skipping = stripped.count("[") - stripped.count("]")
+            continue
+        kept.append(line)
+
+    # Re-add the separators removed objects leave out
+    for i in range(len(kept) - 1):
+        following = kept[i + 1].strip()
+        if following.startswith('"') and not kept[i].rstrip().endswith((",", "{")):
+            kept[i] = kept[i].rstrip() + ","
+    return "\n".join(kept) + ("\n" if schema_text.endswith("\n") else "")
+
+
+# Example usage
+if __name__ == "__main__":
+    extractor = RuleExtractor()
+    examples = [
+        ("Joining Fee: ₹2,500 + GST", {("fees", "joiningFee"): 2500.0}),
+        ("Annual fee Rs. 500, waived on spends of Rs. 50,000", {("fees", "annualFee"): 500.0}),
+        ("Interest: 3.6% per month", {("charges", "interestRateAnnual"): 43.2}),
+        # Waiver and spend thresholds are not fees
+        ("Annual fee waiver on spends of Rs. 3,00,000 in a year", {}),
+        ("Joining fee is waived. Spend Rs 50,000 in 90 days", {}),
+        # "Free" followed by an amount is an offer, not the fee
+        ("Annual fee: Free for the first year, ₹499 thereafter", {}),
+        ("Joining Fee: Nil", {("fees", "joiningFee"): 0.0}),
+    ]
+    for text, expected in examples:
+        found = {path: match.value for path, match in extractor.extract(text).items()}
+        status = "✓" if found == expected else "✗"
+        print(f"{status} {text!r}: {found}")
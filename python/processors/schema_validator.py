@@ -16,13 +16,21 @@ class ValidationResult:
         self.is_valid: bool = True
         self.errors: list[str] = []
         self.warnings: list[str] = []
+        # CreditCard field paths (e.g. "eligibility.minCibilScore") with
+        # errors, and with values that look wrong
+        self.error_fields: list[str] = []
+        self.warning_fields: list[str] = []
     
-    def add_error(self, message: str):
+    def add_error(self, message: str, field: Optional[str] = None):
         self.is_valid = False
         self.errors.append(message)
+        if field and field not in self.error_fields:
+            self.error_fields.append(field)
     
-    def add_warning(self, message: str):
+    def add_warning(self, message: str, field: Optional[str] = None):
         self.warnings.append(message)
+        if field and field not in self.warning_fields:
+            self.warning_fields.append(field)
     
     def __repr__(self):
         status = "VALID" if self.is_valid else "INVALID"
@@ -79,13 +87,13 @@ class SchemaValidator:
         info = card.basicInfo
         
         if not info.name or len(info.name) < 3:
-            result.add_error("Card name is too short or missing")
+            result.add_error("Card name is too short or missing", "basicInfo.name")
         
         if not info.issuer:
             result.add_error("Issuer is missing")
         
         if not info.network:
-            result.add_error("Card network is missing")
+            result.add_error("Card network is missing", "basicInfo.network")
         
         if not info.applyUrl:
             result.add_warning("Apply URL is missing")
@@ -96,15 +104,15 @@ class SchemaValidator:
         
         # Check joining fee is in reasonable range
         if not self.fee_range[0] <= fees.joiningFee <= self.fee_range[1]:
-            result.add_warning(f"Joining fee {fees.joiningFee} seems unusual")
+            result.add_warning(f"Joining fee {fees.joiningFee} seems unusual", "fees.joiningFee")
         
         # Check annual fee
         if not self.fee_range[0] <= fees.annualFee <= self.fee_range[1]:
-            result.add_warning(f"Annual fee {fees.annualFee} seems unusual")
+            result.add_warning(f"Annual fee {fees.annualFee} seems unusual", "fees.annualFee")
         
         # If there's a fee waiver condition, it should be descriptive
         if fees.annualFeeWaiver and len(fees.annualFeeWaiver) < 5:
-            result.add_warning("Annual fee waiver condition is too short")
+            result.add_warning("Annual fee waiver condition is too short", "fees.annualFeeWaiver")
     
     def _validate_eligibility(self, card: CreditCard, result: ValidationResult):
         """Validate eligibility criteria."""
@@ -113,19 +121,19 @@ class SchemaValidator:
         # Min salary check
         if elig.minSalary is not None:
             if not self.salary_range[0] <= elig.minSalary <= self.salary_range[1]:
-                result.add_warning(f"Min salary {elig.minSalary} seems unusual")
+                result.add_warning(f"Min salary {elig.minSalary} seems unusual", "eligibility.minSalary")
         
         # CIBIL score check
         if elig.minCibilScore is not None:
             if not self.cibil_range[0] <= elig.minCibilScore <= self.cibil_range[1]:
-                result.add_error(f"CIBIL score {elig.minCibilScore} is out of valid range")
+                result.add_error(f"CIBIL score {elig.minCibilScore} is out of valid range", "eligibility.minCibilScore")
         
         # Age range check
         if elig.minAge >= elig.maxAge:
-            result.add_error("Min age should be less than max age")
+            result.add_error("Min age should be less than max age", "eligibility.minAge")
         
         if elig.minAge < 18:
-            result.add_error("Min age cannot be less than 18")
+            result.add_error("Min age cannot be less than 18", "eligibility.minAge")
         
         if not elig.employmentType:
             result.add_warning("Employment type is not specified")
@@ -136,11 +144,11 @@ class SchemaValidator:
         
         # Reward rate check
         if not self.reward_rate_range[0] <= rewards.rewardRate <= self.reward_rate_range[1]:
-            result.add_warning(f"Reward rate {rewards.rewardRate}% seems unusual")
+            result.add_warning(f"Reward rate {rewards.rewardRate}% seems unusual", "rewards.rewardRate")
         
         # Point value check
         if rewards.pointValue < 0 or rewards.pointValue > 10:
-            result.add_warning(f"Point value {rewards.pointValue} seems unusual")
+            result.add_warning(f"Point value {rewards.pointValue} seems unusual", "rewards.pointValue")
         
         # Accelerated categories check
         for cat in rewards.acceleratedCategories:
@@ -153,11 +161,11 @@ class SchemaValidator:
         
         # Interest rate check
         if not self.interest_rate_range[0] <= charges.interestRate.annual <= self.interest_rate_range[1]:
-            result.add_warning(f"Annual interest rate {charges.interestRate.annual}% seems unusual")
+            result.add_warning(f"Annual interest rate {charges.interestRate.annual}% seems unusual", "charges.interestRate.annual")
         
         # Foreign transaction fee check
         if charges.foreignTxnFee < 0 or charges.foreignTxnFee > 10:
-            result.add_warning(f"Foreign txn fee {charges.foreignTxnFee}% seems unusual")
+            result.add_warning(f"Foreign txn fee {charges.foreignTxnFee}% seems unusual", "charges.foreignTxnFee")
     
     def _check_data_quality(self, card: CreditCard, result: ValidationResult):
         """Check overall data quality."""
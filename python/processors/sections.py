@@ -0,0 +1,100 @@
+"""
+Section-parallel extraction planning.
+Card pages carry the sections the scraper found ("## Fees & Charges",
+"## Eligibility", ...). Each schema slice (fees, charges, rewards, ...) is
+asked for in its own short prompt with only the sections about it, so the
+prompts run in parallel and each reply stays small.
+"""
+
+import re
+from dataclasses import dataclass
+
+from .chunking import estimate_tokens
+from .context import STRUCTURED_MARKER, select_context
+
+
+# Top-level extraction fields, grouped into slices, with the words in
+# section headers that mark a section as relevant to the slice
+SECTION_SLICES: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "fees": (("fees",), ("fee", "charges", "membership")),
+    "charges": (("charges",), ("charges", "interest", "fee")),
+    "rewards": (("rewards",), ("reward", "cashback", "points", "milestone", "welcome", "benefit")),
+    "eligibility": (("eligibility",), ("eligib", "documents", "who can apply")),
+    "loungeAccess": (("loungeAccess",), ("lounge", "travel", "privilege")),
+    "features": (("features",), ("feature", "insurance", "privilege", "benefit")),
+}
+
+# Card identity fields are taken from the page text around the sections
+OVERVIEW_FIELDS = ("name", "cardType", "network")
+
+SECTION_HEADER = re.compile(r"^## (.+)$")
+
+
+@dataclass
+class SectionTask:
+    """One prompt of a section-parallel extraction."""
+
+    fields: tuple[str, ...]
+    text: str
+
+
+def split_sections(text: str) -> tuple[str, list[tuple[str, str]]]:
+    """
+    Separate page text from the scraper's structured sections.
+
+    Returns:
+        (text before the sections, [(header, section text)])
+    """
+    main, marker, structured = text.partition(STRUCTURED_MARKER)
+    if not marker:
+        return text, []
+
+    sections: list[tuple[str, str]] = []
+    header, lines = None, []
+    for line in structured.splitlines():
+        match = SECTION_HEADER.match(line)
+        if match:
+            if header:
+                sections.append((header, "\n".join(lines).strip()))
+            header, lines = match.group(1).strip(), []
+        elif header:
+            lines.append(line)
+    if header:
+        sections.append((header, "\n".join(lines).strip()))
+    return main.strip(), sections
+
+
+def plan_section_tasks(text: str, max_tokens: int) -> list[SectionTask]:
+    """
+    Split a page into per-slice prompts.
+
+    Every slice gets the sections whose headers mention it; slices no
+    section covers are asked for together with the card identity fields,
+    from the most relevant parts of the whole page. Each task's text is
+    kept within `max_tokens`.
+
+    Returns:
+        [] if the page has no structured sections
+    """
+    main, sections = split_sections(text)
+    if not sections:
+        return []
+
+    tasks = []
+    overview_fields = list(OVERVIEW_FIELDS)
+    for fields, keywords in SECTION_SLICES.values():
+        matching = [
+            f"## {header}\n{body}"
+            for header, body in sections
+            if any(keyword in header.lower() for keyword in keywords)
+        ]
+        if not matching:
+            overview_fields.extend(fields)
+            continue
+        section_text = "\n\n".join(matching)
+        if estimate_tokens(section_text) > max_tokens:
+            section_text = select_context(section_text, max_tokens)
+        tasks.append(SectionTask(fields, section_text))
+
+    tasks.insert(0, SectionTask(tuple(overview_fields), select_context(main, max_tokens)))
+    return tasks
@@ -1,6 +1,15 @@
 """Bank scrapers for credit card data extraction."""
 
-from .base import BaseScraper
+from .archive import HTMLArchive
+from .base import BaseScraper, ScraperConfig
 from .hdfc import HDFCScraper
+from .raw_store import RawCardWriter, iter_raw_cards
 
-__all__ = ["BaseScraper", "HDFCScraper"]
+__all__ = [
+    "BaseScraper",
+    "ScraperConfig",
+    "HDFCScraper",
+    "HTMLArchive",
+    "RawCardWriter",
+    "iter_raw_cards",
+]
@@ -0,0 +1,302 @@
+"""
+Content-addressed archive of raw scraped HTML.
+Pages are stored once per unique body, compressed with zstd using a
+dictionary trained per issuer, and indexed by URL and scrape time so the
+extraction stages can be re-run over historical pages without the network.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class HTMLArchive:
+    """
+    Zstd-compressed page archive.
+
+    Layout under `root`:
+        blobs/ab/abcdef...zst   page bodies, named by SHA-256 of the raw bytes
+        dicts/<issuer>-<id>.dict trained compression dictionaries
+        index.sqlite            (url, issuer, scraped_at) -> blob index
+
+    Bodies are kept exactly as the server sent them; the index records
+    each page's character encoding so it can be decoded when read back.
+    """
+
+    COMPRESSION_LEVEL = 10
+    DICT_SIZE = 112_640  # zstd's default dictionary size
+    MIN_TRAINING_SAMPLES = 10
+
+    def __init__(self, root: str | Path):
+        if zstandard is None:
+            raise ImportError(
+                "zstandard package not installed. "
+                "Install with: pip install zstandard"
+            )
+
+        self.root = Path(root)
+        self.blob_dir = self.root / "blobs"
+        self.dict_dir = self.root / "dicts"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.dict_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._dicts: dict[int, "zstandard.ZstdCompressionDict"] = {}
+        self._conn = sqlite3.connect(
+            self.root / "index.sqlite", timeout=30, check_same_thread=False
+        )
+        with self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS blobs (
+                    sha256 TEXT PRIMARY KEY,
+                    dict_id INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    stored_size INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT NOT NULL,
+                    issuer TEXT NOT NULL,
+                    scraped_at TEXT NOT NULL,
+                    sha256 TEXT NOT NULL REFERENCES blobs(sha256),
+                    encoding TEXT
+                );
+                CREATE INDEX IF NOT EXISTS pages_url ON pages (url, scraped_at);
+                CREATE INDEX IF NOT EXISTS pages_issuer ON pages (issuer, scraped_at);
+                CREATE TABLE IF NOT EXISTS dictionaries (
+                    issuer TEXT NOT NULL,
+                    dict_id INTEGER PRIMARY KEY,
+                    created_at TEXT NOT NULL
+                );
+                """
+            )
+            # Archives created before encodings were recorded
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(pages)")}
+            if "encoding" not in columns:
+                self._conn.execute("ALTER TABLE pages ADD COLUMN encoding TEXT")
+
+    # Dictionaries
+
+    def _dict_path(self, issuer: str, dict_id: int) -> Path:
+        slug = re.sub(r"[^a-z0-9]+", "-", issuer.lower()).strip("-")
+        return self.dict_dir / f"{slug}-{dict_id}.dict"
+
+    def _load_dict(self, dict_id: int) -> Optional["zstandard.ZstdCompressionDict"]:
+        """Load a dictionary by id (0 means no dictionary)."""
+        if dict_id == 0:
+            return None
+        if dict_id not in self._dicts:
+            row = self._conn.execute(
+                "SELECT issuer FROM dictionaries WHERE dict_id = ?", (dict_id,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"Unknown compression dictionary {dict_id}")
+            data = self._dict_path(row[0], dict_id).read_bytes()
+            self._dicts[dict_id] = zstandard.ZstdCompressionDict(data)
+        return self._dicts[dict_id]
+
+    def _current_dict_id(self, issuer: str) -> int:
+        row = self._conn.execute(
+            "SELECT MAX(dict_id) FROM dictionaries WHERE issuer = ?", (issuer,)
+        ).fetchone()
+        return row[0] or 0
+
+    def _compressor(self, dict_id: int) -> "zstandard.ZstdCompressor":
+        return zstandard.ZstdCompressor(
+            level=self.COMPRESSION_LEVEL, dict_data=self._load_dict(dict_id)
+        )
+
+    def _decompressor(self, dict_id: int) -> "zstandard.ZstdDecompressor":
+        return zstandard.ZstdDecompressor(dict_data=self._load_dict(dict_id))
+
+    # Blobs
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self.blob_dir / sha256[:2] / f"{sha256}.zst"
+
+    def _write_blob(self, sha256: str, data: bytes, dict_id: int) -> int:
+        compressed = self._compressor(dict_id).compress(data)
+        path = self._blob_path(sha256)
+        path.parent.mkdir(exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(compressed)
+        tmp_path.replace(path)
+        return len(compressed)
+
+    def put(
+        self,
+        issuer: str,
+        url: str,
+        html: str | bytes,
+        scraped_at: Optional[datetime] = None,
+        encoding: Optional[str] = None,
+    ) -> str:
+        """
+        Archive a fetched page.
+
+        The body is only written if it isn't already stored; every call
+        adds an index entry for (url, scraped_at).
+
+        Args:
+            html: Raw response bytes, or already-decoded text (stored as UTF-8)
+            encoding: Character encoding of raw bytes (UTF-8 if unknown)
+
+        Returns:
+            SHA-256 of the raw page bytes
+        """
+        if isinstance(html, str):
+            data, encoding = html.encode("utf-8"), "utf-8"
+        else:
+            data = html
+        sha256 = hashlib.sha256(data).hexdigest()
+        scraped_at = scraped_at or datetime.now()
+
+        with self._lock, self._conn:
+            exists = self._conn.execute(
+                "SELECT 1 FROM blobs WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+            if not exists:
+                dict_id = self._current_dict_id(issuer)
+                stored_size = self._write_blob(sha256, data, dict_id)
+                self._conn.execute(
+                    "INSERT INTO blobs (sha256, dict_id, size, stored_size) VALUES (?, ?, ?, ?)",
+                    (sha256, dict_id, len(data), stored_size),
+                )
+            self._conn.execute(
+                "INSERT INTO pages (url, issuer, scraped_at, sha256, encoding) VALUES (?, ?, ?, ?, ?)",
+                (url, issuer, scraped_at.isoformat(), sha256, encoding),
+            )
+        return sha256
+
+    def get(self, sha256: str) -> bytes:
+        """Read and decompress a stored page body."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT dict_id FROM blobs WHERE sha256 = ?", (sha256,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(f"Blob not in archive: {sha256}")
+            decompressor = self._decompressor(row[0])
+        return decompressor.decompress(self._blob_path(sha256).read_bytes())
+
+    # Index queries
+
+    def history(self, url: str) -> list[tuple[datetime, str]]:
+        """All (scraped_at, sha256) entries for a URL, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT scraped_at, sha256 FROM pages WHERE url = ? ORDER BY scraped_at",
+                (url,),
+            ).fetchall()
+        return [(datetime.fromisoformat(ts), sha256) for ts, sha256 in rows]
+
+    def iter_latest(
+        self,
+        issuer: str,
+        as_of: Optional[datetime] = None,
+    ) -> Iterator[tuple[str, datetime, str]]:
+        """
+        Yield the newest archived version of each of an issuer's pages.
+
+        Args:
+            issuer: Issuer name as returned by get_issuer_name()
+            as_of: Ignore pages scraped after this time
+
+        Yields:
+            (url, scraped_at, html) tuples, ordered by URL
+        """
+        cutoff = (as_of or datetime.max).isoformat()
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT url, MAX(scraped_at), sha256, encoding FROM pages
+                WHERE issuer = ? AND scraped_at <= ?
+                GROUP BY url ORDER BY url
+                """,
+                (issuer, cutoff),
+            ).fetchall()
+
+        for url, scraped_at, sha256, encoding in rows:
+            html = decode_body(self.get(sha256), encoding)
+            yield url, datetime.fromisoformat(scraped_at), html
+
+    def stats(self) -> dict[str, int]:
+        """Blob count and raw vs stored byte totals."""
+        with self._lock:
+            count, size, stored = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM blobs"
+            ).fetchone()
+        return {"blobs": count, "size": size, "stored_size": stored}
+
+    # Training
+
+    def train_dictionary(self, issuer: str, recompress: bool = True) -> Optional[int]:
+        """
+        Train a zstd dictionary from an issuer's archived pages.
+
+        New pages from the issuer are compressed with it. With `recompress`,
+        existing blobs are re-encoded so older pages shrink too.
+
+        Returns:
+            The new dictionary id, or None if there are too few samples
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT DISTINCT b.sha256, b.dict_id FROM blobs b
+                JOIN pages p ON p.sha256 = b.sha256
+                WHERE p.issuer = ?
+                """,
+                (issuer,),
+            ).fetchall()
+
+        if len(rows) < self.MIN_TRAINING_SAMPLES:
+            print(
+                f"Need at least {self.MIN_TRAINING_SAMPLES} archived pages to "
+                f"train a dictionary for {issuer} (have {len(rows)})"
+            )
+            return None
+
+        samples = [self.get(sha256) for sha256, _ in rows]
+        trained = zstandard.train_dictionary(self.DICT_SIZE, samples)
+
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO dictionaries (issuer, created_at) VALUES (?, ?)",
+                (issuer, datetime.now().isoformat()),
+            )
+            dict_id = cursor.lastrowid
+            self._dict_path(issuer, dict_id).write_bytes(trained.as_bytes())
+            self._dicts[dict_id] = trained
+
+            if recompress:
+                for (sha256, _), data in zip(rows, samples):
+                    stored_size = self._write_blob(sha256, data, dict_id)
+                    self._conn.execute(
+                        "UPDATE blobs SET dict_id = ?, stored_size = ? WHERE sha256 = ?",
+                        (dict_id, stored_size, sha256),
+                    )
+
+        print(f"Trained dictionary {dict_id} for {issuer} from {len(samples)} pages")
+        return dict_id
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def decode_body(data: bytes, encoding: Optional[str] = None) -> str:
+    """Decode archived page bytes, falling back to UTF-8 for unknown encodings."""
+    try:
+        return data.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return data.decode("utf-8", errors="replace")
@@ -4,15 +4,29 @@ All bank-specific scrapers should inherit from this class.
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+import asyncio
+import hashlib
+import json
+import re
+import threading
 import requests
 from bs4 import BeautifulSoup
 import time
 import random
 
 from models import RawCardData
+from .archive import HTMLArchive
+from .cassette import Cassette
+from .http_cache import HTTPCache
+from .parsers import NON_CONTENT_TAGS, BeautifulSoupBackend, get_parser_backend
+from .rate_limit import AdaptiveHostController, HostRateLimiter, parse_retry_after
 
 
 @dataclass
@@ -22,11 +36,49 @@ class ScraperConfig:
     # Request settings
     timeout: int = 30
     max_retries: int = 3
-    retry_delay: float = 2.0
+    retry_delay: float = 2.0  # Base of the jittered exponential backoff
+    max_backoff: float = 60.0
     
-    # Rate limiting
-    min_delay: float = 1.0
-    max_delay: float = 3.0
+    # Rate limiting (token bucket per host)
+    requests_per_second: float = 1.0  # Sustained rate; 0 disables limiting
+    burst: int = 2  # Requests allowed back-to-back before waiting
+    
+    # Concurrency: max in-flight requests per host in the async scrape mode
+    # (1 keeps the original one-card-at-a-time behaviour)
+    max_concurrency_per_host: int = 4
+    
+    # Adaptive (AIMD) concurrency: starts at initial_concurrency, grows while
+    # the host is healthy and halves on 429/5xx or slow responses
+    initial_concurrency: int = 1
+    slow_response_factor: float = 3.0  # Latency vs baseline counted as a slowdown
+    
+    # Circuit breaker: stop requesting a host after repeated failures
+    circuit_failure_threshold: int = 5
+    circuit_cooldown: float = 60.0
+    
+    # HTTP cache: conditional requests against a local SQLite cache
+    cache_path: Optional[str] = None  # None disables caching
+    cache_only: bool = False  # Offline mode: serve only cached pages
+    
+    # Raw HTML archive (zstd, content-addressed); None disables archiving
+    archive_dir: Optional[str] = None
+    
+    # Record/replay: capture every request to a JSONL cassette ("record"),
+    # or serve responses from it without network access ("replay")
+    cassette_path: Optional[str] = None
+    cassette_mode: str = "replay"
+    replay_latency: bool = False  # Sleep for each response's recorded latency
+    
+    # Site root override, e.g. a local mock server (None uses the bank's site)
+    base_url: Optional[str] = None
+    
+    # Crawl frontier for card URL discovery: how many links deep to follow
+    # listing/pagination pages, and where to keep state between runs
+    crawl_max_depth: int = 3
+    frontier_dir: Optional[str] = None  # None keeps no state
+    
+    # HTML parser backend: "lxml" (fast) or "bs4" (BeautifulSoup compatibility)
+    parser_backend: str = "lxml"
     
     # User agent rotation
     user_agents: list[str] = None
@@ -41,6 +93,189 @@ class ScraperConfig:
             ]
 
 
+# Query parameters that never change page content
+TRACKING_PARAMS = frozenset(["gclid", "fbclid", "msclkid", "icid", "ref"])
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str, base: Optional[str] = None) -> str:
+    """
+    Normalize a URL so equivalent spellings compare equal.
+    
+    Resolves it against `base`, lowercases the scheme and host, drops
+    default ports, fragments and tracking parameters, sorts the query and
+    removes trailing slashes.
+    """
+    if base:
+        url = urljoin(base, url)
+    parts = urlparse(url.strip())
+    scheme = parts.scheme.lower()
+    
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    
+    path = re.sub(r"/{2,}", "/", parts.path) or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+    
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ))
+    return urlunparse((scheme, host, path, "", query, ""))
+
+
+class CrawlFrontier:
+    """
+    Breadth-first discovery of card pages through listing pages.
+    
+    Starting from seed listing pages, each level of listing/pagination
+    pages is fetched concurrently; links on them are canonicalized and
+    sorted into card pages (collected, not fetched) and further listing
+    pages (queued for the next level, up to `max_depth`). Visited URLs are
+    kept as 8-byte hashes, so the seen-set stays small on large sites.
+    
+    With a state file, card URLs and listing page links are remembered
+    between runs: new and no longer listed cards are reported, and a
+    listing page whose content is unchanged reuses its recorded links.
+    """
+    
+    VERSION = 1
+    
+    def __init__(
+        self,
+        max_depth: int = 3,
+        max_concurrency: int = 4,
+        state_path: Optional[str | Path] = None,
+    ):
+        self.max_depth = max_depth
+        self.max_concurrency = max(1, max_concurrency)
+        self.state_path = Path(state_path) if state_path else None
+        
+        self._seen: set[bytes] = set()
+        self._queue: deque[tuple[str, int]] = deque()
+        self.card_urls: list[str] = []
+        self.new_cards: list[str] = []
+        self.removed_cards: list[str] = []
+        
+        self.known_cards: dict[str, dict] = {}
+        self.listings: dict[str, dict] = {}
+        if self.state_path and self.state_path.exists():
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("version") == self.VERSION:
+                self.known_cards = state.get("cards", {})
+                self.listings = state.get("listings", {})
+    
+    @staticmethod
+    def _fingerprint(url: str) -> bytes:
+        return hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+    
+    def mark_seen(self, url: str) -> bool:
+        """Record a canonical URL as seen; False if it already was."""
+        fingerprint = self._fingerprint(url)
+        if fingerprint in self._seen:
+            return False
+        self._seen.add(fingerprint)
+        return True
+    
+    def add(self, url: str, depth: int = 0) -> bool:
+        """Queue a listing page for crawling, unless seen or too deep."""
+        url = canonicalize_url(url)
+        if depth > self.max_depth or not self.mark_seen(url):
+            return False
+        self._queue.append((url, depth))
+        return True
+    
+    def crawl(
+        self,
+        fetch: Callable[[str], Optional[str]],
+        extract_links: Callable[[str], Iterable[str]],
+        is_card_page: Callable[[str], bool],
+        is_listing_page: Callable[[str], bool],
+    ) -> list[str]:
+        """
+        Crawl the queued listing pages breadth-first.
+        
+        Args:
+            fetch: Returns a page's HTML, or None if it failed
+            extract_links: Returns the hrefs in a page's HTML
+            is_card_page: Whether a canonical URL is a card detail page
+            is_listing_page: Whether a canonical URL is a listing page to follow
+            
+        Returns:
+            Card page URLs in discovery order
+        """
+        def visit(url: str) -> Optional[list[str]]:
+            html = fetch(url)
+            if html is None:
+                return None
+            page_hash = hashlib.sha256(html.encode("utf-8")).hexdigest()
+            previous = self.listings.get(url)
+            if previous and previous.get("content_hash") == page_hash:
+                return previous["links"]
+            
+            links = []
+            for href in extract_links(html):
+                link = canonicalize_url(href, base=url)
+                if link.startswith(("http://", "https://")):
+                    links.append(link)
+            self.listings[url] = {"content_hash": page_hash, "links": links}
+            return links
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            while self._queue:
+                # One BFS level at a time, fetched concurrently
+                level = list(self._queue)
+                self._queue.clear()
+                results = executor.map(visit, [url for url, _ in level])
+                
+                for (url, depth), links in zip(level, results):
+                    if links is None:
+                        continue
+                    for link in links:
+                        if is_card_page(link):
+                            if self.mark_seen(link):
+                                self.card_urls.append(link)
+                        elif is_listing_page(link):
+                            self.add(link, depth + 1)
+        
+        self._update_known_cards()
+        return self.card_urls
+    
+    def _update_known_cards(self):
+        now = datetime.now().isoformat()
+        found = set(self.card_urls)
+        self.new_cards = [url for url in self.card_urls if url not in self.known_cards]
+        # An empty crawl (e.g. the listing page failed) says nothing about removals
+        if found:
+            self.removed_cards = [url for url in self.known_cards if url not in found]
+        
+        for url in self.card_urls:
+            entry = self.known_cards.setdefault(url, {"first_seen": now})
+            entry["last_seen"] = now
+    
+    def save(self):
+        """Persist known cards and listing page links, if a state file is set."""
+        if not self.state_path:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": self.VERSION,
+                    "cards": self.known_cards,
+                    "listings": self.listings,
+                },
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+
+
 class BaseScraper(ABC):
     """
     Abstract base class for bank credit card scrapers.
@@ -51,9 +286,28 @@ class BaseScraper(ABC):
     - get_issuer_name(): Returns the bank/issuer name
     """
     
+    # Elements dropped by extract_text_content
+    NON_CONTENT_TAGS = NON_CONTENT_TAGS
+    
     def __init__(self, config: Optional[ScraperConfig] = None):
         self.config = config or ScraperConfig()
         self.session = self._create_session()
+        self._host_controllers: dict[str, AdaptiveHostController] = {}
+        self._host_lock = threading.Lock()
+        self.rate_limiter = HostRateLimiter(
+            self.config.requests_per_second,
+            self.config.burst,
+        )
+        self.http_cache = HTTPCache(self.config.cache_path) if self.config.cache_path else None
+        self.archive = HTMLArchive(self.config.archive_dir) if self.config.archive_dir else None
+        self.parser = get_parser_backend(self.config.parser_backend)
+        self.cassette = None
+        if self.config.cassette_path:
+            self.cassette = Cassette(
+                self.config.cassette_path,
+                mode=self.config.cassette_mode,
+                replay_latency=self.config.replay_latency,
+            )
     
     def _create_session(self) -> requests.Session:
         """Create a requests session with default headers."""
@@ -71,43 +325,176 @@ class BaseScraper(ABC):
         """Get a random user agent from the configured list."""
         return random.choice(self.config.user_agents)
     
-    def _rate_limit(self):
-        """Apply rate limiting between requests."""
-        delay = random.uniform(self.config.min_delay, self.config.max_delay)
-        time.sleep(delay)
+    def _rate_limit(self, url: str):
+        """Wait until the URL's host has request budget left."""
+        self.rate_limiter.wait(url)
+    
+    def host_controller(self, url: str) -> AdaptiveHostController:
+        """Get the adaptive concurrency controller for the URL's host."""
+        host = urlparse(url).netloc
+        with self._host_lock:
+            if host not in self._host_controllers:
+                self._host_controllers[host] = AdaptiveHostController(
+                    host,
+                    max_concurrency=self.config.max_concurrency_per_host,
+                    initial_concurrency=self.config.initial_concurrency,
+                    slow_response_factor=self.config.slow_response_factor,
+                    failure_threshold=self.config.circuit_failure_threshold,
+                    cooldown=self.config.circuit_cooldown,
+                )
+            return self._host_controllers[host]
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Jittered exponential backoff, never shorter than Retry-After."""
+        delay = min(self.config.max_backoff, self.config.retry_delay * 2 ** attempt)
+        delay = random.uniform(delay / 2, delay)
+        return max(delay, retry_after or 0.0)
     
     def fetch_page(self, url: str) -> Optional[str]:
         """
         Fetch a page with retries and rate limiting.
         
+        Concurrency per host adapts to server responses: 429 and 5xx
+        replies, network errors and slowdowns shrink it, and Retry-After is
+        honoured. Failed attempts back off exponentially with jitter, and a
+        host whose circuit breaker is open is not contacted at all.
+        
+        With an HTTP cache configured, previously seen pages are requested
+        conditionally and served from the cache on a 304. In cache-only
+        mode no network requests are made at all.
+        
+        When replaying a cassette, responses are served without rate
+        limiting, host slots or backoff (see _replay_page).
+        
         Args:
             url: The URL to fetch
             
         Returns:
             HTML content as string, or None if failed
         """
+        if self.cassette is not None and self.cassette.mode == "replay":
+            return self._replay_page(url)
+        
+        cached = self.http_cache.get(url) if self.http_cache else None
+        
+        if self.config.cache_only:
+            if cached:
+                return cached.body
+            print(f"Not in cache (offline mode): {url}")
+            return None
+        
+        controller = self.host_controller(url)
+        
         for attempt in range(self.config.max_retries):
+            if not controller.allow_request():
+                print(f"Circuit open for {controller.host}, skipping {url}")
+                return None
+            
+            retry_after = None
             try:
-                self._rate_limit()
+                # Hold a host slot only while requesting, not during retry backoff
+                with controller.slot():
+                    self._rate_limit(url)
+                    
+                    headers = {"User-Agent": self._get_random_user_agent()}
+                    if cached:
+                        headers.update(cached.conditional_headers())
+                    started = time.monotonic()
+                    response = self._send_request(url, headers)
+                    latency = time.monotonic() - started
+                
+                if response.status_code == 429 or response.status_code >= 500:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    controller.record_failure(retry_after)
+                elif response.status_code == 304:
+                    # Served from our cache; its latency isn't a page fetch
+                    controller.record_success()
+                else:
+                    controller.record_success(latency)
+                
+                if response.status_code == 304 and cached:
+                    self._archive_page(url, cached.body)
+                    return cached.body
                 
-                headers = {"User-Agent": self._get_random_user_agent()}
-                response = self.session.get(
-                    url,
-                    headers=headers,
-                    timeout=self.config.timeout
-                )
                 response.raise_for_status()
+                if self.http_cache:
+                    self.http_cache.put(
+                        url,
+                        response.text,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
+                self._archive_page(url, response.content, response.encoding)
                 return response.text
                 
             except requests.RequestException as e:
                 print(f"Attempt {attempt + 1} failed for {url}: {e}")
+                if not isinstance(e, requests.HTTPError):
+                    # Connection errors and timeouts; HTTP errors are recorded above
+                    controller.record_failure()
                 if attempt < self.config.max_retries - 1:
-                    time.sleep(self.config.retry_delay * (attempt + 1))
+                    time.sleep(self._backoff_delay(attempt, retry_after))
                     
         return None
     
+    def _replay_page(self, url: str) -> Optional[str]:
+        """
+        Serve a page from the replay cassette.
+        
+        Recorded retries (e.g. a 429 followed by a 200) are replayed in
+        order, but without waiting and without touching the host's
+        concurrency controller, so replay timing only reflects the
+        recorded latency (if enabled) and parsing.
+        
+        Raises:
+            CassetteMiss: If the URL was never recorded; the cassette
+                doesn't match the scrape, so retrying can't help
+        """
+        for attempt in range(self.config.max_retries):
+            response = self.cassette.replay(url)
+            try:
+                response.raise_for_status()
+            except requests.HTTPError as e:
+                print(f"Attempt {attempt + 1} failed for {url}: {e}")
+                continue
+            self._archive_page(url, response.content, response.encoding)
+            return response.text
+        return None
+    
+    def _send_request(self, url: str, headers: dict) -> requests.Response:
+        """Send a GET request, recording it if a cassette is recording."""
+        started = time.monotonic()
+        response = self.session.get(url, headers=headers, timeout=self.config.timeout)
+        if self.cassette is not None:
+            self.cassette.record(url, headers, response, time.monotonic() - started)
+        return response
+    
+    def _archive_page(self, url: str, html: str | bytes, encoding: Optional[str] = None):
+        """
+        Record a fetched page in the HTML archive, if one is configured.
+        
+        Pass the response's raw bytes and encoding where there are some, so
+        the archive keeps exactly what the server sent.
+        """
+        if self.archive:
+            self.archive.put(self.get_issuer_name(), url, html, encoding=encoding)
+    
+    async def fetch_page_async(self, url: str) -> Optional[str]:
+        """
+        Async counterpart of fetch_page.
+        
+        Runs the blocking fetch in a worker thread so several pages can be
+        in flight at once; retries and per-host limits are unchanged.
+        """
+        return await asyncio.to_thread(self.fetch_page, url)
+    
     def parse_html(self, html: str) -> BeautifulSoup:
-        """Parse HTML content into BeautifulSoup object."""
+        """
+        Parse HTML content into BeautifulSoup object.
+        
+        Kept for scrapers written against BeautifulSoup; self.parser is
+        the faster, backend-neutral alternative.
+        """
         return BeautifulSoup(html, "lxml")
     
     def extract_text_content(self, soup: BeautifulSoup) -> str:
@@ -115,16 +502,7 @@ class BaseScraper(ABC):
         Extract clean text content from parsed HTML.
         Removes scripts, styles, and normalizes whitespace.
         """
-        # Remove script and style elements
-        for element in soup(["script", "style", "nav", "footer", "header"]):
-            element.decompose()
-        
-        # Get text and normalize whitespace
-        text = soup.get_text(separator="\n", strip=True)
-        
-        # Remove excessive whitespace
-        lines = [line.strip() for line in text.splitlines() if line.strip()]
-        return "\n".join(lines)
+        return BeautifulSoupBackend().extract_text(soup)
     
     @abstractmethod
     def get_issuer_name(self) -> str:
@@ -154,28 +532,235 @@ class BaseScraper(ABC):
         """
         pass
     
-    def scrape_all_cards(self) -> list[RawCardData]:
+    def is_card_page_url(self, url: str) -> bool:
         """
-        Scrape all credit cards from this issuer.
+        Whether a URL is a card detail page (as opposed to a listing page).
+        
+        Used to pick card pages out of the HTML archive and crawled links;
+        override when the scraper fetches non-card pages.
+        """
+        return True
+    
+    def is_listing_page_url(self, url: str) -> bool:
+        """
+        Whether a crawled link is a listing or pagination page to follow
+        when discovering card URLs.
+        """
+        return False
+    
+    def create_frontier(self) -> CrawlFrontier:
+        """A crawl frontier, persisted under config.frontier_dir if set."""
+        state_path = None
+        if self.config.frontier_dir:
+            name = self.get_issuer_name()
+            if self.config.base_url:
+                # Keep mock or mirror sites apart from the real one
+                name += " " + urlparse(self.config.base_url).netloc
+            slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+            state_path = Path(self.config.frontier_dir) / f"{slug}.json"
+        return CrawlFrontier(
+            max_depth=self.config.crawl_max_depth,
+            max_concurrency=self.config.max_concurrency_per_host,
+            state_path=state_path,
+        )
+    
+    def discover_card_urls(self, seed_urls: list[str]) -> list[str]:
+        """
+        Find card pages by crawling listing pages breadth-first.
+        
+        Links are classified with is_card_page_url() and
+        is_listing_page_url(); only listing pages are fetched.
         
+        Args:
+            seed_urls: Listing pages to start from
+            
         Returns:
-            List of RawCardData objects
+            Canonical card page URLs in discovery order
         """
-        print(f"Starting scrape for {self.get_issuer_name()}...")
+        frontier = self.create_frontier()
+        first_crawl = not frontier.known_cards
+        for url in seed_urls:
+            frontier.add(url)
+        
+        def extract_links(html: str) -> list[str]:
+            return list(self.parser.iter_links(self.parser.parse(html)))
+        
+        urls = frontier.crawl(
+            self.fetch_page,
+            extract_links,
+            self.is_card_page_url,
+            self.is_listing_page_url,
+        )
+        if frontier.state_path:
+            if not first_crawl:
+                print(f"{len(frontier.new_cards)} new cards since the last crawl")
+                for url in frontier.new_cards:
+                    print(f"  + {url}")
+            if frontier.removed_cards:
+                print(f"{len(frontier.removed_cards)} previously seen cards no longer listed")
+            frontier.save()
+        return urls
+    
+    def parse_card_page(
+        self,
+        url: str,
+        html: str,
+        scraped_at: Optional[datetime] = None,
+    ) -> Optional[RawCardData]:
+        """
+        Extract raw data from an already fetched card page.
+        
+        Optional; scrapers that implement it can be re-run over archived
+        pages with scrape_archive() (see supports_reparse()).
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support parsing archived pages"
+        )
+    
+    @classmethod
+    def supports_reparse(cls) -> bool:
+        """Whether this scraper implements parse_card_page()."""
+        return cls.parse_card_page is not BaseScraper.parse_card_page
+    
+    def scrape_archive(
+        self,
+        archive: HTMLArchive,
+        as_of: Optional[datetime] = None,
+    ) -> list[RawCardData]:
+        """
+        Re-run page parsing over archived HTML, without network access.
+        
+        Args:
+            archive: Archive holding previously fetched pages
+            as_of: Use the newest version of each page scraped before this time
+            
+        Returns:
+            List of RawCardData objects, one per archived card URL
         
+        Raises:
+            NotImplementedError: If the scraper can't parse stored pages
+        """
+        if not self.supports_reparse():
+            raise NotImplementedError(
+                f"{type(self).__name__} does not support parsing archived pages"
+            )
+        
+        raw_cards = []
+        for url, scraped_at, html in archive.iter_latest(self.get_issuer_name(), as_of):
+            if not self.is_card_page_url(url):
+                continue
+            raw_data = self.parse_card_page(url, html, scraped_at)
+            if raw_data:
+                raw_cards.append(raw_data)
+        
+        print(f"Re-parsed {len(raw_cards)} archived pages for {self.get_issuer_name()}")
+        return raw_cards
+    
+    def _card_urls_to_scrape(self, skip_urls: Optional[set[str]]) -> list[str]:
+        """Card URLs from get_card_urls(), minus those to skip."""
         urls = self.get_card_urls()
         print(f"Found {len(urls)} card URLs")
+        if skip_urls:
+            remaining = [url for url in urls if url not in skip_urls]
+            print(f"Skipping {len(urls) - len(remaining)} cards already scraped")
+            urls = remaining
+        return urls
+    
+    def scrape_all_cards(
+        self,
+        on_card: Optional[Callable[[RawCardData], None]] = None,
+        skip_urls: Optional[set[str]] = None,
+    ) -> list[RawCardData]:
+        """
+        Scrape all credit cards from this issuer.
+        
+        Uses the async engine when max_concurrency_per_host > 1, otherwise
+        scrapes cards one at a time. Must not be called from a running
+        event loop; await scrape_all_cards_async() there instead.
+        
+        Args:
+            on_card: Called with each card as soon as it is scraped. Cards
+                handed to on_card are not kept, so memory use stays
+                constant and the returned list is empty.
+            skip_urls: Card URLs to leave out, e.g. those already saved by
+                an interrupted scrape
+        
+        Returns:
+            List of RawCardData objects, in card URL order
+        """
+        if self.config.max_concurrency_per_host > 1:
+            return asyncio.run(self.scrape_all_cards_async(on_card, skip_urls))
+        
+        print(f"Starting scrape for {self.get_issuer_name()}...")
+        
+        urls = self._card_urls_to_scrape(skip_urls)
         
         raw_cards = []
+        scraped = 0
         for i, url in enumerate(urls, 1):
             print(f"Scraping card {i}/{len(urls)}: {url}")
             
             raw_data = self.scrape_card_page(url)
             if raw_data:
-                raw_cards.append(raw_data)
+                scraped += 1
+                if on_card:
+                    on_card(raw_data)
+                else:
+                    raw_cards.append(raw_data)
                 print(f"  ✓ Scraped: {raw_data.page_title}")
             else:
                 print(f"  ✗ Failed to scrape")
         
-        print(f"Completed: {len(raw_cards)}/{len(urls)} cards scraped")
+        print(f"Completed: {scraped}/{len(urls)} cards scraped")
+        return raw_cards
+    
+    async def scrape_all_cards_async(
+        self,
+        on_card: Optional[Callable[[RawCardData], None]] = None,
+        skip_urls: Optional[set[str]] = None,
+    ) -> list[RawCardData]:
+        """
+        Scrape all credit cards from this issuer concurrently.
+        
+        Each scrape_card_page call runs in a worker thread, so existing
+        synchronous scrapers need no changes. At most
+        max_concurrency_per_host cards are in flight at once.
+        
+        Args:
+            on_card: Called with each card as soon as it is scraped (in
+                completion order); those cards are not kept
+            skip_urls: Card URLs to leave out
+        
+        Returns:
+            List of RawCardData objects, in card URL order
+        """
+        print(f"Starting scrape for {self.get_issuer_name()}...")
+        
+        urls = await asyncio.to_thread(self._card_urls_to_scrape, skip_urls)
+        
+        in_flight = asyncio.Semaphore(max(1, self.config.max_concurrency_per_host))
+        scraped = 0
+        
+        async def scrape_one(i: int, url: str) -> Optional[RawCardData]:
+            nonlocal scraped
+            async with in_flight:
+                print(f"Scraping card {i}/{len(urls)}: {url}")
+                raw_data = await asyncio.to_thread(self.scrape_card_page, url)
+            if not raw_data:
+                print(f"  ✗ Failed to scrape {url}")
+                return None
+            
+            scraped += 1
+            print(f"  ✓ Scraped: {raw_data.page_title}")
+            if on_card:
+                on_card(raw_data)
+                return None
+            return raw_data
+        
+        results = await asyncio.gather(
+            *(scrape_one(i, url) for i, url in enumerate(urls, 1))
+        )
+        raw_cards = [raw_data for raw_data in results if raw_data]
+        
+        print(f"Completed: {scraped}/{len(urls)} cards scraped")
         return raw_cards
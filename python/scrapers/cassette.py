@@ -0,0 +1,132 @@
+"""
+HTTP record/replay for scrapers.
+
+In record mode every request fetch_page sends is captured, with its
+response, headers and timing, as one line of a JSONL cassette. In replay
+mode the same responses are served back from the cassette, optionally
+with their recorded latency, so scrapes run deterministically without
+network access.
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class CassetteMiss(requests.ConnectionError):
+    """Raised in replay mode when a request was never recorded."""
+
+
+class Cassette:
+    """
+    JSONL cassette of HTTP exchanges.
+
+    Responses for the same URL are replayed in the order they were
+    recorded (so a recorded 429 followed by a 200 replays the same way);
+    once they run out, the last one is repeated.
+    """
+
+    MODES = ("record", "replay")
+
+    def __init__(self, path: str | Path, mode: str = "replay", replay_latency: bool = False):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}'. Available: {', '.join(self.MODES)}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self._lock = threading.Lock()
+        self._entries: dict[str, list[dict]] = defaultdict(list)
+        self._served: dict[str, int] = defaultdict(int)
+
+        if mode == "replay":
+            if not self.path.exists():
+                raise FileNotFoundError(f"Cassette not found: {self.path}")
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["url"]].append(entry)
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def record(
+        self,
+        url: str,
+        request_headers: dict,
+        response: requests.Response,
+        elapsed: float,
+    ):
+        """Append one request/response exchange to the cassette."""
+        entry = {
+            "method": "GET",
+            "url": url,
+            "request_headers": dict(request_headers),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+            "encoding": response.encoding,
+            "body": response.text,
+            "elapsed": elapsed,
+            "recorded_at": datetime.now().isoformat(),
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self._entries[url].append(entry)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def replay(self, url: str) -> requests.Response:
+        """
+        Serve the next recorded response for a URL.
+
+        Raises:
+            CassetteMiss: if the URL was never recorded
+        """
+        with self._lock:
+            entries = self._entries.get(url)
+            if not entries:
+                raise CassetteMiss(f"No recorded response for {url}")
+            index = min(self._served[url], len(entries) - 1)
+            self._served[url] += 1
+            entry = entries[index]
+
+        if self.replay_latency:
+            time.sleep(entry.get("elapsed", 0.0))
+
+        return self._build_response(entry)
+
+    @staticmethod
+    def _build_response(entry: dict) -> requests.Response:
+        encoding = entry.get("encoding") or "utf-8"
+        # The body is stored decoded; drop transfer-level headers
+        headers = CaseInsensitiveDict(entry.get("headers", {}))
+        for name in ("Content-Encoding", "Content-Length", "Transfer-Encoding"):
+            headers.pop(name, None)
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.reason = entry.get("reason") or ""
+        response.headers = headers
+        response.encoding = encoding
+        response._content = entry.get("body", "").encode(encoding, errors="replace")
+        response.url = entry["url"]
+        return response
+
+    def stats(self) -> dict[str, int]:
+        """Recorded exchanges and (in replay mode) how many were served."""
+        with self._lock:
+            return {
+                "urls": len(self._entries),
+                "exchanges": len(self),
+                "served": sum(self._served.values()),
+            }
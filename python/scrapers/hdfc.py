@@ -4,13 +4,38 @@ Extracts credit card data from HDFC Bank's website.
 """
 
 from typing import Optional
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 from datetime import datetime
 
 from .base import BaseScraper, ScraperConfig
+from .parsers import PageScan
 from models import RawCardData
 
 
+# HDFC uses various containers for card details, in order of preference
+CONTENT_SELECTORS = [
+    "main",
+    ".main-content",
+    "#main-content",
+    ".card-details",
+    ".product-details",
+    "article",
+]
+
+# Section headers, in the order sections are reported
+SECTION_HEADERS = [
+    "Features & Benefits",
+    "Fees & Charges",
+    "Eligibility",
+    "Reward Points",
+    "Interest Rates",
+    "Key Features",
+    "Card Benefits",
+]
+
+SECTION_HEADER_TAGS = frozenset(["h1", "h2", "h3", "h4", "div", "span"])
+
+
 class HDFCScraper(BaseScraper):
     """Scraper for HDFC Bank credit cards."""
     
@@ -35,6 +60,10 @@ class HDFCScraper(BaseScraper):
     
     def __init__(self, config: Optional[ScraperConfig] = None):
         super().__init__(config)
+        if self.config.base_url:
+            # Serve the same paths from another host (e.g. a mock server)
+            self.BASE_URL = self.config.base_url.rstrip("/")
+            self.CARDS_LIST_URL = urljoin(self.BASE_URL, urlparse(HDFCScraper.CARDS_LIST_URL).path)
     
     def get_issuer_name(self) -> str:
         return "HDFC Bank"
@@ -43,31 +72,10 @@ class HDFCScraper(BaseScraper):
         """
         Get list of HDFC credit card URLs.
         
-        First tries to scrape from the cards listing page,
-        falls back to known URLs if scraping fails.
+        Crawls the cards listing page (and its pagination) for card
+        links, falls back to known URLs if that finds none.
         """
-        urls = []
-        
-        # Try to scrape the cards listing page
-        html = self.fetch_page(self.CARDS_LIST_URL)
-        if html:
-            soup = self.parse_html(html)
-            
-            # Look for card links in the page
-            # HDFC typically uses specific CSS classes for card links
-            card_links = soup.find_all("a", href=True)
-            
-            for link in card_links:
-                href = link.get("href", "")
-                # Filter for credit card detail pages
-                if "/credit-cards/" in href and "credit-card" in href.lower():
-                    # Skip listing pages and apply pages
-                    if href.endswith("credit-cards") or "apply" in href.lower():
-                        continue
-                    
-                    full_url = urljoin(self.BASE_URL, href)
-                    if full_url not in urls:
-                        urls.append(full_url)
+        urls = self.discover_card_urls([self.CARDS_LIST_URL])
         
         # If no URLs found, use known URLs
         if not urls:
@@ -76,6 +84,16 @@ class HDFCScraper(BaseScraper):
         
         return urls
     
+    def is_listing_page_url(self, url: str) -> bool:
+        """The cards listing page, including its other result pages."""
+        return urlparse(url).path.rstrip("/") == urlparse(self.CARDS_LIST_URL).path
+    
+    def is_card_page_url(self, url: str) -> bool:
+        """Card detail pages, excluding the listing page and apply pages."""
+        if "/credit-cards/" not in url or "credit-card" not in url.lower():
+            return False
+        return not (url.endswith("credit-cards") or "apply" in url.lower())
+    
     def scrape_card_page(self, url: str) -> Optional[RawCardData]:
         """
         Scrape a single HDFC card detail page.
@@ -91,105 +109,54 @@ class HDFCScraper(BaseScraper):
         if not html:
             return None
         
-        soup = self.parse_html(html)
+        return self.parse_card_page(url, html)
+    
+    def parse_card_page(
+        self,
+        url: str,
+        html: str,
+        scraped_at: Optional[datetime] = None,
+    ) -> Optional[RawCardData]:
+        """Extract raw card data from fetched (or archived) page HTML."""
+        doc = self.parser.parse(html)
+        scan = self.parser.scan_page(
+            doc, CONTENT_SELECTORS, SECTION_HEADERS, SECTION_HEADER_TAGS
+        )
         
         # Get page title
-        title_tag = soup.find("title")
-        page_title = title_tag.get_text(strip=True) if title_tag else "Unknown Card"
+        page_title = scan.title or "Unknown Card"
         
         # Clean up title (remove " - HDFC Bank" suffix)
         if " - " in page_title:
             page_title = page_title.split(" - ")[0].strip()
         
-        # Extract main content
-        # HDFC uses various containers for card details
-        content_selectors = [
-            "main",
-            ".main-content",
-            "#main-content",
-            ".card-details",
-            ".product-details",
-            "article",
-        ]
-        
-        main_content = None
-        for selector in content_selectors:
-            if selector.startswith("."):
-                main_content = soup.find(class_=selector[1:])
-            elif selector.startswith("#"):
-                main_content = soup.find(id=selector[1:])
-            else:
-                main_content = soup.find(selector)
-            
-            if main_content:
-                break
-        
-        # If no specific content area found, use body
-        if not main_content:
-            main_content = soup.find("body") or soup
+        # Main content: first matching selector, else the body
+        main_content = scan.main_content
         
         # Extract text content
-        text_content = self.extract_text_content(main_content)
+        text_content = self.parser.extract_text(main_content)
         
         # Also try to extract specific sections
-        sections = self._extract_hdfc_sections(soup)
+        sections = self._extract_hdfc_sections(scan)
         if sections:
             text_content = f"{text_content}\n\n--- STRUCTURED SECTIONS ---\n{sections}"
         
         return RawCardData(
             url=url,
-            html_content=str(main_content),
+            html_content=self.parser.to_html(main_content),
             text_content=text_content,
             page_title=page_title,
             issuer=self.get_issuer_name(),
-            scraped_at=datetime.now()
+            scraped_at=scraped_at or datetime.now()
         )
     
-    def _extract_hdfc_sections(self, soup) -> str:
+    def _extract_hdfc_sections(self, scan: PageScan) -> str:
         """
         Extract specific sections from HDFC card pages.
         HDFC often uses accordion/tab structures for different sections.
         """
-        sections = []
-        
-        # Look for common section patterns
-        section_headers = [
-            "Features & Benefits",
-            "Fees & Charges", 
-            "Eligibility",
-            "Reward Points",
-            "Interest Rates",
-            "Key Features",
-            "Card Benefits",
-        ]
-        
-        for header_text in section_headers:
-            # Find headers containing this text
-            headers = soup.find_all(
-                ["h1", "h2", "h3", "h4", "div", "span"],
-                string=lambda t: t and header_text.lower() in t.lower()
-            )
-            
-            for header in headers:
-                # Get the next sibling or parent's content
-                content = ""
-                
-                # Try to get content from next sibling
-                next_elem = header.find_next_sibling()
-                if next_elem:
-                    content = next_elem.get_text(separator="\n", strip=True)
-                
-                # Or from parent container
-                if not content:
-                    parent = header.find_parent(["div", "section"])
-                    if parent:
-                        content = parent.get_text(separator="\n", strip=True)
-                
-                if content and len(content) > 50:  # Only include substantial content
-                    sections.append(f"## {header_text}\n{content}")
-                    break
-        
-        return "\n\n".join(sections)
+        sections = self.parser.extract_sections(scan)
+        return "\n\n".join(f"## {header}\n{content}" for header, content in sections)
 
 
 # Example usage
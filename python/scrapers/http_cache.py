@@ -0,0 +1,98 @@
+"""
+Persistent HTTP cache for scraped pages.
+Stores page bodies with their validators so later runs can send
+conditional requests and reuse the cached body on a 304.
+"""
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+
+@dataclass
+class CachedResponse:
+    """A cached page body and its HTTP validators."""
+
+    url: str
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: datetime
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that ask the server to reply 304 if the page is unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPCache:
+    """
+    SQLite-backed page cache keyed by URL.
+
+    Safe to share between the worker threads of one scraper; separate
+    scrapers may open the same file.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    body TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at TEXT NOT NULL
+                )
+                """
+            )
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Look up a cached page."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        body, etag, last_modified, fetched_at = row
+        return CachedResponse(
+            url=url,
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=datetime.fromisoformat(fetched_at),
+        )
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Store (or replace) a page and its validators."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO pages (url, body, etag, last_modified, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (url, body, etag, last_modified, datetime.now().isoformat()),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,394 @@
+"""
+HTML parser backends for scrapers.
+
+Scrapers extract text and sections through a ParserBackend instead of
+calling BeautifulSoup directly. The "lxml" backend works on raw lxml.html
+trees and is several times faster; the "bs4" backend is kept for
+compatibility with code that expects BeautifulSoup objects.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, Optional
+
+import lxml.html
+from bs4 import BeautifulSoup, NavigableString, Tag
+from lxml import etree
+
+
+# Elements dropped before extracting text
+NON_CONTENT_TAGS = frozenset(["script", "style", "nav", "footer", "header"])
+
+
+@lru_cache(maxsize=32)
+def _header_pattern(section_headers: tuple[str, ...]) -> re.Pattern:
+    """One case-insensitive pattern matching any of the section headers."""
+    return re.compile(
+        "|".join(re.escape(header) for header in section_headers), re.IGNORECASE
+    )
+
+
+@dataclass
+class PageScan:
+    """Everything needed to extract a page, collected in one walk of the DOM."""
+
+    title: Optional[str] = None
+    # Highest-preference content container, or the body (or document)
+    main_content: Any = None
+    # Section headers being looked for, in the order they are reported
+    section_headers: list[str] = field(default_factory=list)
+    # Elements whose text may name a section header, in document order
+    header_candidates: list[Any] = field(default_factory=list)
+
+
+class ParserBackend(ABC):
+    """
+    Parses HTML and answers the DOM questions scrapers ask.
+
+    Subclasses implement a handful of tree primitives; page scanning, text
+    extraction and section lookup are shared on top of them.
+    """
+
+    name: str = ""
+
+    # Tree primitives
+
+    @abstractmethod
+    def parse(self, html: str) -> Any:
+        """Parse a page into a document."""
+
+    @abstractmethod
+    def iter_elements(self, doc: Any) -> Iterator[tuple[Any, str, dict]]:
+        """Yield (element, tag name, attributes) in document order."""
+
+    @abstractmethod
+    def element_string(self, element: Any, skip: frozenset = frozenset()) -> Optional[str]:
+        """
+        BeautifulSoup's Tag.string: the text of an element whose only
+        child (recursively) is a single string. Child elements named in
+        `skip` are ignored.
+        """
+
+    @abstractmethod
+    def get_text(self, element: Any, separator: str = "\n") -> str:
+        """Stripped, non-empty text fragments of an element, joined by separator."""
+
+    @abstractmethod
+    def remove_non_content(self, node: Any):
+        """Remove NON_CONTENT_TAGS elements below node, in place."""
+
+    @abstractmethod
+    def is_removed(self, element: Any) -> bool:
+        """Whether an element was removed from its document."""
+
+    @abstractmethod
+    def next_sibling_element(self, element: Any) -> Optional[Any]:
+        """The next sibling that is an element."""
+
+    @abstractmethod
+    def find_parent(self, element: Any, names: Iterable[str]) -> Optional[Any]:
+        """The nearest ancestor with one of the given tag names."""
+
+    @abstractmethod
+    def to_html(self, node: Any) -> str:
+        """Serialize a node back to HTML."""
+
+    @abstractmethod
+    def iter_links(self, doc: Any) -> Iterator[str]:
+        """Yield the href of every link, in document order."""
+
+    # Shared extraction
+
+    def scan_page(
+        self,
+        doc: Any,
+        content_selectors: list[str],
+        section_headers: list[str],
+        header_tags: frozenset,
+    ) -> PageScan:
+        """
+        Walk the DOM once, collecting the title, the preferred content
+        container and candidate section headers.
+
+        Args:
+            doc: Parsed document
+            content_selectors: "tag", ".class" or "#id" selectors, most
+                preferred first; the body is used if none match
+            section_headers: Header texts to look for (case-insensitive)
+            header_tags: Tag names that may hold a section header
+        """
+        tag_selectors, class_selectors, id_selectors = {}, {}, {}
+        for index, selector in enumerate(content_selectors):
+            if selector.startswith("."):
+                class_selectors[selector[1:]] = index
+            elif selector.startswith("#"):
+                id_selectors[selector[1:]] = index
+            else:
+                tag_selectors[selector] = index
+        header_pattern = _header_pattern(tuple(section_headers))
+
+        scan = PageScan(section_headers=list(section_headers))
+        containers: dict[int, Any] = {}
+        title = body = None
+
+        for element, name, attrs in self.iter_elements(doc):
+            if name == "title" and title is None:
+                title = element
+            elif name == "body" and body is None:
+                body = element
+
+            index = tag_selectors.get(name)
+            if index is not None and index not in containers:
+                containers[index] = element
+            if "class" in attrs:
+                classes = attrs["class"]
+                for css_class in classes.split() if isinstance(classes, str) else classes:
+                    index = class_selectors.get(css_class)
+                    if index is not None and index not in containers:
+                        containers[index] = element
+            if "id" in attrs:
+                index = id_selectors.get(attrs["id"])
+                if index is not None and index not in containers:
+                    containers[index] = element
+
+            if name in header_tags:
+                # Text extraction may later strip non-content children,
+                # which can change the element's string; check both forms
+                text = self.element_string(element)
+                if not (text and header_pattern.search(text)):
+                    text = self.element_string(element, NON_CONTENT_TAGS)
+                if text and header_pattern.search(text):
+                    scan.header_candidates.append(element)
+
+        if title is not None:
+            scan.title = self.get_text(title, separator="")
+        if containers:
+            scan.main_content = containers[min(containers)]
+        else:
+            scan.main_content = body if body is not None else doc
+        return scan
+
+    def extract_text(self, node: Any) -> str:
+        """
+        Extract clean text content from a node.
+        Removes scripts, styles and page chrome, and normalizes whitespace.
+        """
+        self.remove_non_content(node)
+        text = self.get_text(node)
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        return "\n".join(lines)
+
+    def extract_sections(self, scan: PageScan, min_length: int = 50) -> list[tuple[str, str]]:
+        """
+        Find the content following each section header.
+
+        For every header text, the first candidate (in document order) with
+        more than `min_length` characters of content wins. Candidates are
+        re-checked against the tree as it is now, so call this after
+        extract_text() has stripped the main content.
+
+        Returns:
+            (header text, content) pairs in scan.section_headers order
+        """
+        matches: dict[str, list[Any]] = {header: [] for header in scan.section_headers}
+        for element in scan.header_candidates:
+            if self.is_removed(element):
+                continue
+            text = self.element_string(element)
+            if not text:
+                continue
+            lowered = text.lower()
+            for header in scan.section_headers:
+                if header.lower() in lowered:
+                    matches[header].append(element)
+
+        sections = []
+        contents: dict[int, str] = {}
+        for header in scan.section_headers:
+            for element in matches[header]:
+                if id(element) not in contents:
+                    contents[id(element)] = self._section_content(element)
+                content = contents[id(element)]
+                if content and len(content) > min_length:
+                    sections.append((header, content))
+                    break
+        return sections
+
+    def _section_content(self, header: Any) -> str:
+        """Get the text following a section header."""
+        content = ""
+
+        # Try to get content from next sibling
+        next_elem = self.next_sibling_element(header)
+        if next_elem is not None:
+            content = self.get_text(next_elem)
+
+        # Or from parent container
+        if not content:
+            parent = self.find_parent(header, ("div", "section"))
+            if parent is not None:
+                content = self.get_text(parent)
+
+        return content
+
+
+class BeautifulSoupBackend(ParserBackend):
+    """BeautifulSoup (over lxml) backend; the original scraper behaviour."""
+
+    name = "bs4"
+
+    def parse(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, "lxml")
+
+    def iter_elements(self, doc: BeautifulSoup) -> Iterator[tuple[Tag, str, dict]]:
+        for node in doc.descendants:
+            if isinstance(node, Tag):
+                yield node, node.name, node.attrs
+
+    def element_string(self, element: Tag, skip: frozenset = frozenset()) -> Optional[str]:
+        if not skip:
+            return element.string
+        while True:
+            children = [
+                child for child in element.contents
+                if not (isinstance(child, Tag) and child.name in skip)
+            ]
+            if len(children) != 1:
+                return None
+            if isinstance(children[0], NavigableString):
+                return children[0]
+            element = children[0]
+
+    def get_text(self, element: Tag, separator: str = "\n") -> str:
+        return element.get_text(separator=separator, strip=True)
+
+    def remove_non_content(self, node: Tag):
+        for element in node(list(NON_CONTENT_TAGS)):
+            element.decompose()
+
+    def is_removed(self, element: Tag) -> bool:
+        return element.decomposed
+
+    def next_sibling_element(self, element: Tag) -> Optional[Tag]:
+        return element.find_next_sibling()
+
+    def find_parent(self, element: Tag, names: Iterable[str]) -> Optional[Tag]:
+        return element.find_parent(list(names))
+
+    def to_html(self, node: Tag) -> str:
+        return str(node)
+
+    def iter_links(self, doc: BeautifulSoup) -> Iterator[str]:
+        for link in doc.find_all("a", href=True):
+            yield link.get("href", "")
+
+
+class LxmlBackend(ParserBackend):
+    """
+    Raw lxml.html backend.
+
+    Mirrors BeautifulSoup's text and .string semantics (comments and
+    script/style text are not page text), so both backends extract the
+    same content from ordinary pages.
+    """
+
+    name = "lxml"
+
+    # Text nodes that BeautifulSoup's get_text() skips. lxml parses
+    # <template> contents as ordinary elements, so nested text counts too
+    _TEXT_XPATH = etree.XPath(
+        ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+    )
+
+    def parse(self, html: str) -> Any:
+        if not html or not html.strip():
+            return lxml.html.document_fromstring("<html></html>")
+        try:
+            return lxml.html.document_fromstring(html)
+        except etree.ParserError:
+            return lxml.html.document_fromstring("<html></html>")
+
+    def iter_elements(self, doc: Any) -> Iterator[tuple[Any, str, dict]]:
+        for element in doc.iter(etree.Element):
+            yield element, element.tag, element.attrib
+
+    @staticmethod
+    def _is_element(node: Any) -> bool:
+        return isinstance(node, etree._Element) and isinstance(node.tag, str)
+
+    def _children(self, element: Any, skip: frozenset) -> list:
+        """Child strings and elements, as BeautifulSoup would list them."""
+        children = []
+        if element.text is not None:
+            children.append(element.text)
+        for child in element:
+            if not isinstance(child.tag, str):
+                # Comments and processing instructions count as strings
+                children.append(child.text or "")
+            elif child.tag not in skip:
+                children.append(child)
+            if child.tail is not None:
+                children.append(child.tail)
+        return children
+
+    def element_string(self, element: Any, skip: frozenset = frozenset()) -> Optional[str]:
+        while True:
+            children = self._children(element, skip)
+            if len(children) != 1:
+                return None
+            if isinstance(children[0], str):
+                return children[0]
+            element = children[0]
+
+    def get_text(self, element: Any, separator: str = "\n") -> str:
+        fragments = (str(text).strip() for text in self._TEXT_XPATH(element))
+        return separator.join(fragment for fragment in fragments if fragment)
+
+    def remove_non_content(self, node: Any):
+        doomed = [
+            element for element in node.iter(*NON_CONTENT_TAGS)
+            if element is not node
+        ]
+        for element in doomed:
+            if not self.is_removed(element):
+                element.drop_tree()
+
+    def is_removed(self, element: Any) -> bool:
+        root = element
+        for root in element.iterancestors():
+            pass
+        return root.tag != "html"
+
+    def next_sibling_element(self, element: Any) -> Optional[Any]:
+        sibling = element.getnext()
+        while sibling is not None and not isinstance(sibling.tag, str):
+            sibling = sibling.getnext()
+        return sibling
+
+    def find_parent(self, element: Any, names: Iterable[str]) -> Optional[Any]:
+        return next(element.iterancestors(*names), None)
+
+    def to_html(self, node: Any) -> str:
+        return lxml.html.tostring(node, encoding="unicode", with_tail=False)
+
+    def iter_links(self, doc: Any) -> Iterator[str]:
+        for link in doc.iter("a"):
+            href = link.get("href")
+            if href is not None:
+                yield href
+
+
+PARSER_BACKENDS: dict[str, type[ParserBackend]] = {
+    BeautifulSoupBackend.name: BeautifulSoupBackend,
+    LxmlBackend.name: LxmlBackend,
+}
+
+
+def get_parser_backend(name: str) -> ParserBackend:
+    """Instantiate a parser backend by name ('lxml' or 'bs4')."""
+    if name not in PARSER_BACKENDS:
+        available = ", ".join(PARSER_BACKENDS)
+        raise ValueError(f"Unknown parser backend '{name}'. Available: {available}")
+    return PARSER_BACKENDS[name]()
@@ -0,0 +1,229 @@
+"""
+Per-host rate limiting for scrapers.
+Token buckets make requests wait only when a host's budget is used up;
+adaptive controllers tune per-host concurrency from server responses.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterator, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Holds up to `burst` tokens and refills at `rate` tokens per second.
+    Each request takes one token; when the bucket is empty the caller
+    sleeps just long enough for its token to be refilled.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def reserve(self) -> float:
+        """
+        Take a token and return how long to wait before using it.
+
+        Tokens may go negative so concurrent callers queue up in order
+        instead of all waking at the same moment.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """Block until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class HostRateLimiter:
+    """Keeps one TokenBucket per host."""
+
+    def __init__(self, requests_per_second: float, burst: int = 1):
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        """Get (or create) the bucket for the URL's host."""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.requests_per_second, self.burst)
+            return self._buckets[host]
+
+    def wait(self, url: str):
+        """Block until a request to the URL's host is allowed."""
+        self.bucket_for(url).acquire()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds to wait.
+
+    Accepts both delay-seconds and HTTP-date forms.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveHostController:
+    """
+    AIMD concurrency control and circuit breaker for one host.
+
+    The concurrency limit grows by about one slot per limit's worth of
+    healthy responses and halves on 429/5xx, network errors or responses
+    much slower than the host's baseline latency. Retry-After pauses all
+    requests to the host. After `failure_threshold` consecutive failures
+    the circuit opens and requests are refused until `cooldown` passes;
+    then a single probe request decides whether it closes again.
+    """
+
+    LATENCY_SMOOTHING = 0.2  # EWMA weight of the newest sample
+    # Much slower EWMA used as the "normal" latency, so one unusually fast
+    # response can't set the bar for every later one
+    BASELINE_SMOOTHING = 0.02
+
+    def __init__(
+        self,
+        host: str,
+        max_concurrency: int,
+        initial_concurrency: int = 1,
+        slow_response_factor: float = 3.0,
+        failure_threshold: int = 5,
+        cooldown: float = 60.0,
+    ):
+        self.host = host
+        self.max_limit = max(1, max_concurrency)
+        self.limit = float(min(max(1, initial_concurrency), self.max_limit))
+        self.slow_response_factor = slow_response_factor
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.latency_ewma: Optional[float] = None
+        self.latency_baseline: Optional[float] = None
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one of the host's concurrency slots for a request."""
+        with self._cond:
+            while True:
+                pause = self.paused_until - time.monotonic()
+                if pause > 0:
+                    self._cond.wait(pause)
+                elif self.in_flight < int(self.limit):
+                    break
+                else:
+                    self._cond.wait()
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self.in_flight -= 1
+                self._cond.notify_all()
+
+    def allow_request(self) -> bool:
+        """False while the circuit is open (host considered down)."""
+        with self._cond:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            # Half-open: let a single probe request through
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self, latency: Optional[float] = None):
+        """
+        Record a healthy response and its latency.
+
+        Args:
+            latency: Seconds the request took; None for responses whose
+                timing says nothing about server load (e.g. 304 Not
+                Modified), which are kept out of the latency statistics
+        """
+        with self._cond:
+            self.consecutive_failures = 0
+            if self.opened_at is not None:
+                print(f"Circuit closed for {self.host}")
+                self.opened_at = None
+                self._probing = False
+
+            if latency is not None:
+                if self.latency_ewma is None:
+                    self.latency_ewma = self.latency_baseline = latency
+                else:
+                    self.latency_ewma += self.LATENCY_SMOOTHING * (latency - self.latency_ewma)
+                    self.latency_baseline += self.BASELINE_SMOOTHING * (latency - self.latency_baseline)
+
+            if latency is not None and latency > self.slow_response_factor * self.latency_baseline:
+                self._decrease()
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def record_failure(self, retry_after: Optional[float] = None):
+        """Record an overload signal (429/5xx) or a network failure."""
+        with self._cond:
+            now = time.monotonic()
+            self.consecutive_failures += 1
+            self._decrease()
+            if retry_after:
+                self.paused_until = max(self.paused_until, now + retry_after)
+
+            if self._probing or self.consecutive_failures >= self.failure_threshold:
+                if self.opened_at is None or self._probing:
+                    print(f"Circuit opened for {self.host} after {self.consecutive_failures} failures")
+                self.opened_at = now
+                self._probing = False
+
+    def _decrease(self):
+        """Halve the limit, at most once per typical response time."""
+        now = time.monotonic()
+        window = max(1.0, self.latency_ewma or 0.0)
+        if now - self._last_decrease >= window:
+            self.limit = max(1.0, self.limit / 2)
+            self._last_decrease = now
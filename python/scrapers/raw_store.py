@@ -0,0 +1,206 @@
+"""
+Streaming storage for raw scraped card data.
+
+Raw data is stored as JSONL, one card per line, gzip-compressed when the
+file name ends in .gz. Cards are appended and flushed as they are
+scraped, so an interrupted scrape keeps everything written so far and can
+be resumed; readers load one card at a time. Files in the older format
+(a single JSON array) can still be read.
+"""
+
+import gzip
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Iterator
+
+from models import RawCardData
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def raw_card_to_dict(card: RawCardData) -> dict:
+    """The stored form of a raw card (page HTML is not kept)."""
+    return {
+        "url": card.url,
+        "text_content": card.text_content,
+        "page_title": card.page_title,
+        "issuer": card.issuer,
+        "scraped_at": card.scraped_at.isoformat(),
+        "content_hash": card.content_hash,
+    }
+
+
+def raw_card_from_dict(item: dict) -> RawCardData:
+    return RawCardData(
+        url=item["url"],
+        text_content=item["text_content"],
+        page_title=item["page_title"],
+        issuer=item["issuer"],
+        scraped_at=datetime.fromisoformat(item["scraped_at"]),
+        content_hash=item.get("content_hash"),
+    )
+
+
+def _iter_records(path: Path, strict: bool = False) -> Iterator[dict]:
+    """
+    Yield stored card dicts from a JSONL (or legacy JSON array) file.
+
+    A truncated last record, as left by an interrupted scrape, is skipped
+    with a warning unless `strict` is set.
+    """
+    with _open(path, "r") as f:
+        try:
+            first = f.read(1)
+            while first.isspace():
+                first = f.read(1)
+            if first == "[":
+                # Legacy format: one JSON array
+                yield from json.loads(first + f.read())
+                return
+
+            pending = first
+            for line in f:
+                line = pending + line
+                pending = ""
+                if not line.strip():
+                    continue
+                if not line.endswith("\n"):
+                    # Last line, never terminated: possibly cut short
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        if strict:
+                            raise
+                        print(f"Skipping truncated record at end of {path}")
+                        return
+                    yield record
+                    return
+                yield json.loads(line)
+        except (EOFError, gzip.BadGzipFile):
+            if strict:
+                raise
+            print(f"Skipping truncated data at end of {path}")
+
+
+def iter_raw_cards(path: str | Path) -> Iterator[RawCardData]:
+    """
+    Lazily read raw cards from a raw data file.
+
+    Args:
+        path: JSONL, gzipped JSONL or legacy JSON array file
+
+    Yields:
+        RawCardData objects in file order
+    """
+    for item in _iter_records(Path(path)):
+        yield raw_card_from_dict(item)
+
+
+def read_scraped_urls(path: str | Path) -> set[str]:
+    """URLs of the cards already stored in a raw data file (empty if missing)."""
+    path = Path(path)
+    if not path.exists():
+        return set()
+    return {item["url"] for item in _iter_records(path)}
+
+
+def read_content_hashes(path: str | Path) -> dict[str, str]:
+    """Content hash of every card in a raw data file, by URL (empty if missing)."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return {card.url: card.content_hash for card in iter_raw_cards(path)}
+
+
+class RawCardWriter:
+    """
+    Appends raw cards to a JSONL file as they are scraped.
+
+    Every card is flushed to disk as soon as it is written. Safe to share
+    between threads (e.g. banks scraped in parallel into one file).
+    """
+
+    def __init__(self, path: str | Path, append: bool = False):
+        """
+        Args:
+            path: Output file; gzip-compressed if it ends in .gz
+            append: Keep existing cards (for resumed scrapes) instead of
+                starting a new file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        self._lock = threading.Lock()
+
+        if append and self.path.exists() and not self._is_clean_jsonl():
+            self._rewrite_as_jsonl()
+        self._file = _open(self.path, "a" if append else "w")
+
+    def _is_clean_jsonl(self) -> bool:
+        """Whether new records can be appended to the existing file as-is."""
+        try:
+            for _ in _iter_records(self.path, strict=True):
+                pass
+        except (ValueError, EOFError, gzip.BadGzipFile):
+            return False
+
+        with _open(self.path, "r") as f:
+            first = f.read(1)
+            while first.isspace():
+                first = f.read(1)
+            if first == "[":
+                return False
+
+        if self.path.suffix != ".gz" and self.path.stat().st_size:
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) == b"\n"
+        return True
+
+    def _rewrite_as_jsonl(self):
+        """
+        Rewrite a legacy or interrupted file as clean JSONL, dropping any
+        truncated last record.
+        """
+        # Keep the suffix so the temporary file is compressed the same way
+        tmp_path = self.path.with_name(f".{self.path.stem}.tmp{self.path.suffix}")
+        with _open(tmp_path, "w") as out:
+            for item in _iter_records(self.path):
+                out.write(json.dumps(item, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, card: RawCardData):
+        """
+        Append one card and flush it to disk.
+
+        Raises:
+            ValueError: If the writer has been closed
+        """
+        line = json.dumps(raw_card_to_dict(card), ensure_ascii=False) + "\n"
+        with self._lock:
+            if self._file.closed:
+                raise ValueError(f"RawCardWriter for {self.path} is closed")
+            self._file.write(line)
+            self._file.flush()
+            self.count += 1
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "RawCardWriter":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()